@@ -0,0 +1,50 @@
+import timeit
+import asyncio
+
+from web3 import AsyncWeb3
+from eth_account import Account
+
+from src.artifacts import artifacts
+from src.calldata import calldata_templates
+from src.vars import ETHBRIDGE_ABI, WETH_ABI, ERC20_ABI, ERC721_ABI
+
+
+ITERATIONS = 20000
+
+MORKIE_MINT_DATA = '0x84bb1e42000000000000000000000000{}0000000000000000000000000000000000000000000000000000000000000001000000000000000000000000eeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000c0000000000000000000000000000000000000000000000000000000000000016000000000000000000000000000000000000000000000000000000000000000800000000000000000000000000000000000000000000000000000000000000000ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+
+
+async def main() -> None:
+    w3 = AsyncWeb3()
+    address = Account.create().address
+    amount = 250000 * 10 ** 18
+    extra_data = '0x7375706572627269646765'
+
+    cases = []
+    for abi_path, method, template_args, values, args in (
+        (ETHBRIDGE_ABI, 'bridgeETHTo', (None, 200000, extra_data), (address,), (address, 200000, extra_data)),
+        (WETH_ABI, 'deposit', (), (), ()),
+        (ERC20_ABI, 'mint', (None, None), (address, amount), (address, amount)),
+        (ERC20_ABI, 'burn', (None,), (amount,), (amount,)),
+        (ERC20_ABI, 'pause', (), (), ()),
+        (ERC721_ABI, 'createCollectible', (), (), ())
+    ):
+        contract = await artifacts.get_contract(w3, abi_path)
+        template = await calldata_templates.get(abi_path, method, template_args)
+        cases.append((method, lambda t=template, v=values: t.encode(*v), lambda c=contract, m=method, a=args: c.encode_abi(m, args=a)))
+
+    morkie = calldata_templates.morkie_mint
+    cases.append(('morkie claim', lambda: morkie.encode(address), lambda: MORKIE_MINT_DATA.format(address.lower()[2:])))
+
+    print(f'{"method":<20}{"template, us":>14}{"baseline, us":>14}{"speedup":>10}  identical')
+    for method, encode_template, encode_baseline in cases:
+        identical = encode_template() == encode_baseline()
+        template_time = timeit.timeit(encode_template, number=ITERATIONS) / ITERATIONS * 1e6
+        baseline_time = timeit.timeit(encode_baseline, number=ITERATIONS) / ITERATIONS * 1e6
+        print(f'{method:<20}{template_time:>14.2f}{baseline_time:>14.2f}{baseline_time / template_time:>9.1f}x  {identical}')
+        if not identical:
+            raise SystemExit(f'{method}: template output differs from the baseline')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
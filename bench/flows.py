@@ -0,0 +1,165 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import builtins
+import tempfile
+
+import ujson
+
+import config
+
+
+FLOWS = {
+    'bridge': 1,
+    'wrap': 2,
+    'erc721': 3,
+    'erc20': 4,
+    'morkie_unicorn': 5,
+    'morkie_europa': 6,
+    'random': 7
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run one menu flow against local nodes and print its metrics as JSON')
+    parser.add_argument('--flow', choices=FLOWS, required=True)
+    parser.add_argument('--keys-file', required=True)
+    parser.add_argument('--l1-rpc', required=True)
+    parser.add_argument('--l2-rpc', required=True)
+    parser.add_argument('--wallets', type=int, required=True)
+    parser.add_argument('--concurrency', type=int, default=config.SCHEDULER_PARAMS['max_in_flight'])
+    parser.add_argument('--contracts', type=int, default=1, help='Contracts per wallet for the erc721 and erc20 flows')
+    parser.add_argument('--simulate', action='store_true')
+    return parser.parse_args()
+
+
+def configure(args: argparse.Namespace) -> None:
+    config.RPCS.update(ethereum_sepolia=args.l1_rpc, unichain_sepolia=args.l2_rpc)
+    config.DELAY_BETWEEN_TX = (0, 0)
+    config.SCHEDULER_PARAMS.update(max_in_flight=args.concurrency, start_rate=1000, burst=args.wallets)
+    config.SNAPSHOT_PARAMS['preflight'] = False
+    config.WALLET_PARAMS.update(cache=False)
+    builtins.input = lambda *_: str(args.contracts)
+
+
+def get_peak_rss() -> int:
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from loguru import logger
+    from src.menu import Menu
+    from src.names import name_pool
+    from src.journal import journal
+    from src.artifacts import artifacts
+    from src.pipeline import tx_pipeline
+    from src.providers import provider_pool
+    from src.wallets import WalletSource
+    from src.receipts import ReceiptTracker
+    from src.deposits import DepositWatcher
+    from src.simulation import simulator
+    from src.bridge import L1_STANDARD_BRIDGE
+    from src.models import ethereum_sepolia, unichain_sepolia
+
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    submitted_at: dict[str, float] = {}
+    latencies: list[float] = []
+    deposits: dict[str, int] = {}
+    submit = tx_pipeline.submit
+    wait_for_receipt = ReceiptTracker.wait_for_receipt
+
+    async def timed_submit(w3, tx_params, private_key):
+        started_at = time.monotonic()
+        tx_hash = await submit(w3, tx_params, private_key)
+        submitted_at[ReceiptTracker.normalize_hash(tx_hash)] = started_at
+        if (tx_params.get('to') or '').lower() == L1_STANDARD_BRIDGE.lower():
+            deposits[tx_params['from'].lower()] = tx_params.get('value', 0)
+        return tx_hash
+
+    async def timed_wait_for_receipt(tracker, tx_hash, timeout):
+        receipt = await wait_for_receipt(tracker, tx_hash, timeout)
+        started_at = submitted_at.pop(ReceiptTracker.normalize_hash(tx_hash), None)
+        if started_at is not None:
+            latencies.append(time.monotonic() - started_at)
+        return receipt
+
+    async def instant_deposit(watcher, wallet_address, timeout):
+        return deposits.pop(wallet_address.lower(), None)
+
+    tx_pipeline.submit = timed_submit
+    ReceiptTracker.wait_for_receipt = timed_wait_for_receipt
+    DepositWatcher.wait_for_deposit = instant_deposit
+
+    journal_dir = tempfile.TemporaryDirectory()
+    journal.path = os.path.join(journal_dir.name, 'journal.sqlite3')
+    if args.simulate:
+        simulator.enable()
+    else:
+        journal.open()
+    await artifacts.preload()
+    await name_pool.preload()
+    wallets = WalletSource(args.keys_file, shuffle=False)
+
+    try:
+        for network in (ethereum_sepolia, unichain_sepolia):
+            await provider_pool.verify_chain_id(network)
+
+        started_at = time.monotonic()
+        await Menu().handle_choice(FLOWS[args.flow], wallets)
+        elapsed = time.monotonic() - started_at
+
+        rpc_calls = sum(w3.provider.rpc_calls for w3 in provider_pool.web3s.values())
+        http_requests = sum(w3.provider.http_requests for w3 in provider_pool.web3s.values())
+    finally:
+        await tx_pipeline.close()
+        await provider_pool.close()
+        journal.close()
+        journal_dir.cleanup()
+        wallets.close()
+
+    if args.simulate:
+        summary = simulator.summary()
+        transactions = summary['succeeded'] + summary['unverifiable']
+    else:
+        transactions = tx_pipeline.broadcast_metrics.processed - tx_pipeline.broadcast_metrics.failed
+    return {
+        'flow': args.flow,
+        'wallets': args.wallets,
+        'transactions': transactions,
+        'failed': summary['failed'] if args.simulate else tx_pipeline.broadcast_metrics.failed,
+        'confirmed': len(latencies),
+        'elapsed_s': round(elapsed, 3),
+        'tx_per_s': round(transactions / elapsed, 3) if elapsed else 0.0,
+        'rpc_calls': rpc_calls,
+        'http_requests': http_requests,
+        'rpc_calls_per_tx': round(rpc_calls / transactions, 2) if transactions else None,
+        'latency_p50_ms': round(percentile(latencies, 0.5) * 1000, 1),
+        'latency_p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+        'peak_rss_bytes': get_peak_rss()
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    configure(args)
+    print(ujson.dumps(asyncio.run(run(args))))
+
+
+if __name__ == '__main__':
+    main()
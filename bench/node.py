@@ -0,0 +1,161 @@
+import argparse
+
+import ujson
+from aiohttp import web
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3.providers.eth_tester import EthereumTesterProvider
+from web3.providers.eth_tester.defaults import API_ENDPOINTS, static_return
+from eth_tester import EthereumTester, PyEVMBackend
+from eth_tester.exceptions import TransactionFailed
+from eth_utils import to_canonical_address, to_int
+from eth_utils.decorators import replace_exceptions
+from eth.exceptions import Revert, InvalidInstruction
+from eth.vm.spoof import SpoofTransaction
+
+
+DEFAULT_CALLER = '0x7E5F4552091A69125d5DfCb7b8C2659029395Bdf'
+
+STAND_IN_CODE = '0x34600101335500'
+
+STATE_OVERRIDE_METHODS = ('eth_call', 'eth_estimateGas')
+
+
+def to_rpc(value):
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return hex(value)
+    if isinstance(value, (bytes, bytearray, HexBytes)):
+        return '0x' + bytes(value).hex()
+    if isinstance(value, (dict, AttributeDict)):
+        return {key: to_rpc(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_rpc(item) for item in value]
+    return value
+
+
+def to_value(value) -> int:
+    return to_int(hexstr=value) if isinstance(value, str) else value
+
+
+class BenchBackend(PyEVMBackend):
+    def __init__(self, *args, **kwargs) -> None:
+        self.state_override = None
+        super().__init__(*args, **kwargs)
+        for _, vm_class in self.chain.vm_configuration:
+            build_state = vm_class.build_state
+            vm_class.build_state = classmethod(lambda cls, *args, build_state=build_state: self.apply_state_override(build_state(*args)))
+
+    def apply_state_override(self, state):
+        for address, fields in (self.state_override or {}).items():
+            address = to_canonical_address(address)
+            if 'balance' in fields:
+                state.set_balance(address, to_value(fields['balance']))
+            if 'nonce' in fields:
+                state.set_nonce(address, to_value(fields['nonce']))
+            if 'code' in fields:
+                state.set_code(address, bytes(HexBytes(fields['code'])))
+            for slot, value in fields.get('stateDiff', {}).items():
+                state.set_storage(address, to_value(slot), to_value(value))
+        return state
+
+    @replace_exceptions({InvalidInstruction: TransactionFailed, Revert: TransactionFailed})
+    def call(self, transaction, block_number='latest'):
+        if 'gas' not in transaction:
+            transaction = dict(transaction, gas=self._max_available_gas())
+        if 'gas_price' not in transaction and 'max_fee_per_gas' not in transaction:
+            transaction = dict(transaction, max_fee_per_gas=0, max_priority_fee_per_gas=0)
+        evm_transaction = self._get_normalized_and_unsigned_evm_transaction(transaction, block_number)
+        spoofed_transaction = SpoofTransaction(evm_transaction, from_=transaction['from'])
+        with self.chain.get_vm(self.chain.get_canonical_head()).in_costless_state() as state:
+            computation = state.apply_transaction(spoofed_transaction)
+        computation.raise_if_error()
+        return computation.output
+
+
+class TesterNode:
+    def __init__(self, chain_id: int, addresses: list[str], balance: int, stand_ins: list[str] = ()) -> None:
+        genesis_state = {
+            bytes.fromhex(address[2:]): {'balance': balance, 'nonce': 0, 'code': b'', 'storage': {}}
+            for address in [DEFAULT_CALLER, *addresses]
+        }
+        for address in stand_ins:
+            genesis_state[bytes.fromhex(address[2:])] = {'balance': 0, 'nonce': 1, 'code': bytes(HexBytes(STAND_IN_CODE)), 'storage': {}}
+
+        self.backend = BenchBackend(genesis_state=genesis_state)
+        type(self.backend.chain).chain_id = chain_id
+        api_endpoints = {namespace: dict(endpoints) for namespace, endpoints in API_ENDPOINTS.items()}
+        api_endpoints['eth']['chainId'] = static_return(chain_id)
+        self.w3 = Web3(EthereumTesterProvider(EthereumTester(self.backend), api_endpoints=api_endpoints))
+
+    def fee_history(self, block_count, percentiles: list) -> dict:
+        latest = self.w3.eth.block_number
+        oldest = max(0, latest - to_value(block_count) + 1)
+        blocks = [self.w3.eth.get_block(number) for number in range(oldest, latest + 1)]
+        base_fees = [block['baseFeePerGas'] for block in blocks]
+        return {
+            'oldestBlock': oldest,
+            'baseFeePerGas': base_fees + base_fees[-1:],
+            'gasUsedRatio': [block['gasUsed'] / block['gasLimit'] for block in blocks],
+            'reward': [[0] * len(percentiles) for _ in blocks]
+        }
+
+    def call(self, request: dict) -> dict:
+        method = request.get('method')
+        params = request.get('params') or []
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+
+        if method in STATE_OVERRIDE_METHODS and len(params) > 2:
+            params, self.backend.state_override = params[:2], params[2]
+        try:
+            if method == 'eth_feeHistory':
+                result = {'result': self.fee_history(params[0], params[2] if len(params) > 2 else [])}
+            else:
+                result = self.w3.manager._make_request(method, params)
+        except Exception as e:
+            response['error'] = {'code': -32000, 'message': str(e)}
+            return response
+        finally:
+            self.backend.state_override = None
+
+        if 'error' in result:
+            error = result['error']
+            response['error'] = error if isinstance(error, dict) else {'code': -32601, 'message': str(error)}
+        else:
+            response['result'] = to_rpc(result.get('result'))
+        return response
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json(loads=ujson.loads)
+        if isinstance(payload, list):
+            body = [self.call(item) for item in payload]
+        else:
+            body = self.call(payload)
+        return web.Response(text=ujson.dumps(body), content_type='application/json')
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='In-process EVM node (py-evm) served over JSON-RPC')
+    parser.add_argument('--port', type=int, required=True)
+    parser.add_argument('--chain-id', type=int, required=True)
+    parser.add_argument('--addresses-file', required=True, help='File with one address to fund per line')
+    parser.add_argument('--balance', type=int, default=10 ** 21, help='Balance in wei for every funded address')
+    parser.add_argument('--stand-ins', nargs='*', default=[], help='Addresses that get a stand-in contract accepting any call')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    with open(args.addresses_file) as f:
+        addresses = [line.strip() for line in f if line.strip()]
+
+    node = TesterNode(args.chain_id, addresses, args.balance, args.stand_ins)
+    app = web.Application(client_max_size=64 * 1024 ** 2)
+    app.router.add_post('/', node.handle)
+    web.run_app(app, host='127.0.0.1', port=args.port, print=None, access_log=None)
+
+
+if __name__ == '__main__':
+    main()
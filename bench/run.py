@@ -0,0 +1,183 @@
+import os
+import sys
+import time
+import shutil
+import random
+import socket
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+import ujson
+import aiohttp
+from eth.vm import forks
+from eth_account import Account
+
+from bench.flows import FLOWS
+from bench.node import STAND_IN_CODE
+from src.vars import RESULTS_DIR
+from src.wrap import WETH_ADDRESS
+from src.bridge import L1_STANDARD_BRIDGE
+from src.morkie import UNICORN_NFT_ADDRESS, EUROPA_NFT_ADDRESS
+
+
+NETWORKS = (('l1', 11155111), ('l2', 1301))
+
+CANCUN_FLOWS = ('erc721', 'erc20')
+
+STAND_INS = {
+    'l1': (L1_STANDARD_BRIDGE,),
+    'l2': (WETH_ADDRESS, UNICORN_NFT_ADDRESS, EUROPA_NFT_ADDRESS)
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark menu flows against local EVM nodes')
+    parser.add_argument('--wallets', type=int, default=20)
+    parser.add_argument('--flows', nargs='+', choices=FLOWS, default=list(FLOWS))
+    parser.add_argument('--node', choices=('auto', 'anvil', 'tester'), default='auto', help='anvil if it is installed, otherwise the in-process py-evm node')
+    parser.add_argument('--concurrency', type=int, default=None, help='Wallets processed at the same time, defaults to SCHEDULER_PARAMS max_in_flight')
+    parser.add_argument('--contracts', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--simulate', action='store_true', help='Run the flows in --simulate mode')
+    parser.add_argument('--output', default=None, help='Report path, defaults to results/bench_<date>.json')
+    return parser.parse_args()
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_node(rpc: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.post(rpc, json={'jsonrpc': '2.0', 'method': 'eth_chainId', 'params': [], 'id': 1}) as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f'Node at {rpc} did not start in {timeout} seconds')
+            await asyncio.sleep(0.2)
+
+
+async def setup_anvil(rpc: str, addresses: list[str], balance: int, stand_ins: tuple) -> None:
+    requests = [('anvil_setBalance', [address, hex(balance)]) for address in addresses]
+    requests += [('anvil_setCode', [address, STAND_IN_CODE]) for address in stand_ins]
+    async with aiohttp.ClientSession() as session:
+        for i in range(0, len(requests), 500):
+            payload = [
+                {'jsonrpc': '2.0', 'method': method, 'params': params, 'id': j}
+                for j, (method, params) in enumerate(requests[i:i + 500])
+            ]
+            async with session.post(rpc, json=payload) as response:
+                response.raise_for_status()
+
+
+def start_node(node: str, chain_id: int, port: int, addresses_path: str, balance: int, stand_ins: tuple) -> subprocess.Popen:
+    if node == 'anvil':
+        command = ['anvil', '--port', str(port), '--chain-id', str(chain_id), '--silent']
+    else:
+        command = [sys.executable, '-m', 'bench.node', '--port', str(port), '--chain-id', str(chain_id), '--addresses-file', addresses_path, '--balance', str(balance), '--stand-ins', *stand_ins]
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL)
+
+
+def run_flow(flow: str, keys_path: str, rpcs: dict, args: argparse.Namespace) -> dict:
+    command = [
+        sys.executable, '-m', 'bench.flows', '--flow', flow, '--keys-file', keys_path,
+        '--l1-rpc', rpcs['l1'], '--l2-rpc', rpcs['l2'], '--wallets', str(args.wallets), '--contracts', str(args.contracts)
+    ]
+    if args.concurrency:
+        command += ['--concurrency', str(args.concurrency)]
+    if args.simulate:
+        command += ['--simulate']
+
+    completed = subprocess.run(command, stdout=subprocess.PIPE, text=True)
+    if completed.returncode != 0:
+        return {'flow': flow, 'error': f'exit code {completed.returncode}'}
+
+    result = ujson.loads(completed.stdout.strip().splitlines()[-1])
+    if not result['transactions']:
+        result['error'] = 'no transactions sent'
+    return result
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main() -> None:
+    args = parse_args()
+    node = args.node if args.node != 'auto' else 'anvil' if shutil.which('anvil') else 'tester'
+    balance = 1000 * 10 ** 18
+
+    rng = random.Random(args.seed)
+    keys = ['0x' + rng.getrandbits(256).to_bytes(32, 'big').hex() for _ in range(args.wallets)]
+    addresses = [Account.from_key(key).address for key in keys]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        keys_path = os.path.join(tmp_dir, 'private_keys.txt')
+        addresses_path = os.path.join(tmp_dir, 'addresses.txt')
+        with open(keys_path, 'w') as f:
+            f.write('\n'.join(keys))
+        with open(addresses_path, 'w') as f:
+            f.write('\n'.join(addresses))
+
+        rpcs = {}
+        processes = []
+        try:
+            for name, chain_id in NETWORKS:
+                port = get_free_port()
+                rpcs[name] = f'http://127.0.0.1:{port}'
+                processes.append(start_node(node, chain_id, port, addresses_path, balance, STAND_INS[name]))
+
+            for name, rpc in rpcs.items():
+                asyncio.run(wait_for_node(rpc))
+                if node == 'anvil':
+                    asyncio.run(setup_anvil(rpc, addresses, balance, STAND_INS[name]))
+
+            results = []
+            lacks_cancun = node == 'tester' and not hasattr(forks, 'CancunVM')
+            for flow in args.flows:
+                if lacks_cancun and flow in CANCUN_FLOWS:
+                    results.append({'flow': flow, 'skipped': 'backend lacks Cancun'})
+                    print(f'Skipping {flow}: skipped (backend lacks Cancun), install anvil to benchmark deploys.', flush=True)
+                    continue
+
+                print(f'Running {flow} for {args.wallets} wallets on {node}...', flush=True)
+                results.append(run_flow(flow, keys_path, rpcs, args))
+                print(ujson.dumps(results[-1]), flush=True)
+        finally:
+            for process in processes:
+                process.terminate()
+                process.wait()
+
+    report = {
+        'commit': get_commit(),
+        'node': node,
+        'wallets': args.wallets,
+        'simulate': args.simulate,
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'flows': results
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f'bench_{time.strftime("%Y%m%d_%H%M%S")}.json')
+    with open(output, 'w') as f:
+        ujson.dump(report, f, indent=4)
+    print(f'Report saved to {output}')
+
+    failed = [result['flow'] for result in results if 'error' in result]
+    if failed:
+        print(f'Flows with errors: {", ".join(failed)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
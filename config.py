@@ -2,7 +2,9 @@ BRIDGE_PARAMS = {
     "min_balance": False, 
     "amount": False, 
     "percent": (5, 10),
-    "timeout": 120 
+    "timeout": 120,
+    "pipeline": False,
+    "follow_up": None
 }
 
 WRAP_PARAMS = {
@@ -11,21 +13,123 @@ WRAP_PARAMS = {
     "percent": (1, 2)
 }
 
-RANDOM_CONFIG = {
-    'max_actions': {
-        'erc721_count': (1, 1),
-        'erc20_count': (1, 1),
-        'wrap_count': (1, 1)
-    },
-    'mint_morkie_nfts': True
+WORKFLOW = {
+    "erc721_deploy": {"count": (1, 1)},
+    "erc721_mint": {"needs": ["erc721_deploy"]},
+    "erc20_deploy": {"count": (1, 1)},
+    "erc20_interact": {"needs": ["erc20_deploy"]},
+    "wrap": {"count": (1, 1)},
+    "morkie_unicorn": {"weight": 1},
+    "morkie_europa": {"weight": 1}
+}
+
+SIMULATION_PARAMS = {
+    "balance_override": None
 }
 
 RPCS = {
-    "ethereum_sepolia": 'https://ethereum-sepolia-rpc.publicnode.com',
-    "unichain_sepolia": 'https://sepolia.unichain.org/'
+    "ethereum_sepolia": ['https://ethereum-sepolia-rpc.publicnode.com'],
+    "unichain_sepolia": ['https://sepolia.unichain.org/']
+}
+
+ROUTER_PARAMS = {
+    "latency_alpha": 0.2,
+    "error_alpha": 0.1,
+    "cooldown": 15,
+    "max_cooldown": 300,
+    "explore_ratio": 0.05,
+    "broadcast_fanout": 1
+}
+
+RPC_POOL_PARAMS = {
+    "limit_per_host": 50,
+    "keepalive_timeout": 30,
+    "request_timeout": 30,
+    "idle_providers": 100,
+    "idle_timeout": 30
+}
+
+LIMITER_PARAMS = {
+    "enabled": True,
+    "initial_limit": 20,
+    "min_limit": 1,
+    "max_limit": 200,
+    "increase": 1,
+    "decrease": 0.5,
+    "backoff": 1,
+    "max_backoff": 30,
+    "max_retries": 5
+}
+
+RPC_BATCH_PARAMS = {
+    "enabled": True,
+    "window_ms": 10,
+    "max_size": 100
+}
+
+METRICS_PARAMS = {
+    "enabled": True,
+    "summary_interval": 60,
+    "prometheus_port": None
+}
+
+FEE_PARAMS = {
+    "eip1559": True,
+    "ttl": 12,
+    "history_blocks": 5,
+    "reward_percentile": 50,
+    "base_fee_multiplier": 2,
+    "min_priority_fee_gwei": 0.001,
+    "refresh_on_block": False
+}
+
+BLOCK_TRACKER_PARAMS = {
+    "poll_interval": 1,
+    "max_catch_up_blocks": 20,
+    "sweep_blocks": 3
+}
+
+GAS_CACHE_PARAMS = {
+    "enabled": True,
+    "multiplier": 1.2,
+    "ttl": 300,
+    "max_blocks": 150
+}
+
+PIPELINE_PARAMS = {
+    "executor": "process",
+    "sign_workers": None,
+    "broadcasters": 32,
+    "queue_size": 1000
 }
 
 DELAY_BETWEEN_TX = (5, 12)
-DELAY_BETWEEN_ACC = (10, 20)
+
+SCHEDULER_PARAMS = {
+    "max_in_flight": 20,
+    "start_rate": 0.1,
+    "burst": 1,
+    "per_proxy": 3
+}
+
+SNAPSHOT_PARAMS = {
+    "chunk_size": 300,
+    "concurrency": 4,
+    "max_age": 300,
+    "preflight": True
+}
+
+NAME_POOL_PARAMS = {
+    "seed": None,
+    "no_repeat": True
+}
+
+WALLET_PARAMS = {
+    "cache": True,
+    "block_size": 10000,
+    "chunk_size": 1000,
+    "derive_workers": None,
+    "shuffle_seed": None
+}
 
 SHUFFLE_WALLETS = True
\ No newline at end of file
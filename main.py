@@ -1,9 +1,21 @@
 import asyncio
+import argparse
+import multiprocessing
 
 from loguru import logger
 
 from src.menu import Menu
 from src.utils import Utils
+from src.gas import gas_estimates
+from src.artifacts import artifacts
+from src.journal import journal
+from src.metrics import rpc_metrics
+from src.names import name_pool
+from src.pipeline import tx_pipeline
+from src.providers import provider_pool
+from src.simulation import simulator
+from src.wallets import WalletSource
+from src.models import ethereum_sepolia, unichain_sepolia
 from src.vars import PRIVATE_KEYS_PATH, PROXIES_PATH, LOGS_PATH
 
 
@@ -11,12 +23,47 @@ logger.add(sink=LOGS_PATH, format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {me
 
 menu = Menu()
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Unichain Testnet Soft')
+    parser.add_argument('--resume', action='store_true', help='Skip steps already completed in the last journaled run')
+    parser.add_argument('--simulate', action='store_true', help='Run every transaction with eth_call instead of broadcasting it')
+    return parser.parse_args()
+
 async def main():
+    args = parse_args()
     choice = menu.open_menu()
-    private_keys = await Utils.read_strings_from_file(PRIVATE_KEYS_PATH)
+    if choice == 9:
+        logger.info('Exiting...')
+        return None
     proxies = await Utils.read_strings_from_file(PROXIES_PATH)
-    await menu.handle_choice(choice, private_keys, proxies)
+    wallets = WalletSource(PRIVATE_KEYS_PATH, proxies)
+    await artifacts.preload()
+    if choice in (3, 4, 7):
+        await name_pool.preload()
+    if args.simulate:
+        simulator.enable()
+    else:
+        journal.open(resume=args.resume)
+        name_pool.set_seed(journal.remember('name_seed', name_pool.seed))
+    await rpc_metrics.start()
+    try:
+        for network in (ethereum_sepolia, unichain_sepolia):
+            await provider_pool.verify_chain_id(network)
+        if args.resume and not args.simulate:
+            await journal.reconcile()
+        await menu.handle_choice(choice, wallets)
+    finally:
+        await tx_pipeline.close()
+        await provider_pool.close()
+        await rpc_metrics.close()
+        journal.close()
+        wallets.close()
+        if args.simulate:
+            simulator.save()
+    logger.info(f'Artifact cache stats: {artifacts.stats()}')
+    logger.info(f'Gas estimate cache stats: {gas_estimates.stats()}')
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     asyncio.run(main())
     
\ No newline at end of file
@@ -0,0 +1,80 @@
+import weakref
+from typing import Optional, Union
+
+from web3 import AsyncWeb3
+from loguru import logger
+
+from src.utils import Utils
+from src.vars import ETHBRIDGE_ABI, WETH_ABI, MULTICALL3_ABI, ERC721_ABI, ERC721_BYTECODE, ERC20_ABI, ERC20_BYTECODE
+
+
+class ArtifactRegistry:
+    def __init__(self) -> None:
+        self.abis: dict[str, list] = {}
+        self.bytecodes: dict[str, bytes] = {}
+        self.factories: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    async def preload(self, abi_paths: tuple = (ETHBRIDGE_ABI, WETH_ABI, MULTICALL3_ABI, ERC721_ABI, ERC20_ABI), bytecode_paths: tuple = (ERC721_BYTECODE, ERC20_BYTECODE)) -> None:
+        for path in abi_paths:
+            await self.load_abi(path)
+        for path in bytecode_paths:
+            await self.load_bytecode(path)
+        logger.info(f'Preloaded {len(self.abis)} ABIs and {len(self.bytecodes)} bytecodes.')
+
+    async def load_abi(self, path: str) -> list:
+        if path not in self.abis:
+            self.abis[path] = await Utils.read_json(path)
+        return self.abis[path]
+
+    async def load_bytecode(self, path: str) -> bytes:
+        if path not in self.bytecodes:
+            contents = (await Utils.read_file(path)).strip()
+            self.bytecodes[path] = bytes.fromhex(contents.removeprefix('0x'))
+        return self.bytecodes[path]
+
+    async def get_abi(self, path: str) -> list:
+        if path in self.abis:
+            self.hits += 1
+            return self.abis[path]
+        self.misses += 1
+        return await self.load_abi(path)
+
+    async def get_bytecode(self, path: str) -> bytes:
+        if path in self.bytecodes:
+            self.hits += 1
+            return self.bytecodes[path]
+        self.misses += 1
+        return await self.load_bytecode(path)
+
+    async def get_contract(self, w3: AsyncWeb3, abi_path: str, address: Optional[str] = None, bytecode_path: Optional[str] = None):
+        w3_factories = self.factories.setdefault(w3, {})
+        key = (abi_path, bytecode_path)
+        factory = w3_factories.get(key)
+
+        if factory is None:
+            self.misses += 1
+            abi = await self.load_abi(abi_path)
+            if bytecode_path:
+                factory = w3.eth.contract(abi=abi, bytecode=await self.load_bytecode(bytecode_path))
+            else:
+                factory = w3.eth.contract(abi=abi)
+            w3_factories[key] = factory
+        else:
+            self.hits += 1
+
+        if address:
+            return factory(address=AsyncWeb3.to_checksum_address(address))
+        return factory
+
+    def stats(self) -> dict[str, Union[int, float]]:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0
+        }
+
+
+artifacts = ArtifactRegistry()
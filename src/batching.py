@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, Optional
+
+from config import RPC_BATCH_PARAMS
+
+
+class RequestBatcher:
+    def __init__(self, provider, batch_params: dict = RPC_BATCH_PARAMS) -> None:
+        self.provider = provider
+        self.batch_params = batch_params
+        self.queue: list[tuple[str, Any, asyncio.Future]] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.tasks: set[asyncio.Task] = set()
+        self.batches_sent = 0
+        self.requests_sent = 0
+
+    async def request(self, method: str, params: Any) -> dict:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.queue.append((method, params, future))
+
+        if len(self.queue) >= self.batch_params['max_size']:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.batch_params['window_ms'] / 1000, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+        batch, self.queue = self.queue, []
+        if batch:
+            task = asyncio.create_task(self.send(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def send(self, batch: list[tuple[str, Any, asyncio.Future]]) -> None:
+        self.batches_sent += 1
+        self.requests_sent += len(batch)
+
+        try:
+            if len(batch) == 1:
+                responses = [await self.provider.send_request(batch[0][0], batch[0][1])]
+            else:
+                responses = await self.provider.make_batch_request([(method, params) for method, params, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
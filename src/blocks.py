@@ -0,0 +1,82 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+from src.models import Network
+from src.fees import fee_oracles
+from src.gas import gas_estimates
+from src.providers import provider_pool
+from config import BLOCK_TRACKER_PARAMS, FEE_PARAMS
+
+
+class BlockTracker:
+    def __init__(self, network: Network, tracker_params: dict = BLOCK_TRACKER_PARAMS) -> None:
+        self.network = network
+        self.tracker_params = tracker_params
+        self.subscribers: list[Callable[[int], Awaitable[None]]] = []
+        self.block_number: Optional[int] = None
+        self.holders = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def subscribe(self, callback: Callable[[int], Awaitable[None]]) -> None:
+        self.subscribers.append(callback)
+
+    def hold(self) -> None:
+        self.holders += 1
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.follow())
+
+    def release(self) -> None:
+        self.holders = max(0, self.holders - 1)
+
+    async def follow(self) -> None:
+        w3 = provider_pool.get_web3(self.network)
+
+        while self.holders > 0:
+            try:
+                head = await w3.eth.block_number
+                if self.block_number is None:
+                    self.block_number = head - 1
+
+                first_block = max(self.block_number + 1, head - self.tracker_params['max_catch_up_blocks'] + 1)
+                for block_number in range(first_block, head + 1):
+                    self.block_number = block_number
+                    await self.dispatch(block_number)
+
+            except Exception as e:
+                logger.warning(f'{self.network.name} | Error following blocks: {e}')
+
+            await asyncio.sleep(self.tracker_params['poll_interval'])
+
+    async def dispatch(self, block_number: int) -> None:
+        for callback in self.subscribers:
+            try:
+                await callback(block_number)
+            except Exception as e:
+                logger.warning(f'{self.network.name} | Error handling block {block_number}: {e}')
+
+
+class BlockTrackerRegistry:
+    def __init__(self) -> None:
+        self.trackers: dict[str, BlockTracker] = {}
+
+    def get(self, network: Network) -> BlockTracker:
+        tracker = self.trackers.get(network.name)
+        if tracker is None:
+            tracker = BlockTracker(network)
+            self.subscribe_caches(tracker)
+            self.trackers[network.name] = tracker
+        return tracker
+
+    @staticmethod
+    def subscribe_caches(tracker: BlockTracker) -> None:
+        async def on_block(block_number: int) -> None:
+            gas_estimates.on_new_block(tracker.network, block_number)
+            if FEE_PARAMS['refresh_on_block']:
+                fee_oracles.get(tracker.network).invalidate()
+
+        tracker.subscribe(on_block)
+
+
+block_trackers = BlockTrackerRegistry()
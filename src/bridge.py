@@ -5,13 +5,26 @@ from loguru import logger
 from src.utils import Utils
 from src.client import Client
 from src.manager import Manager
+from src.deposits import deposit_watchers
+from src.simulation import simulator
 from config import BRIDGE_PARAMS
 from src.vars import ETHBRIDGE_ABI
 
 
+L1_STANDARD_BRIDGE = '0xea58fcA6849d79EAd1f26608855c2D6407d54Ce2'
+
+
 class BridgeManager:  
     async def bridge_eth(self, client_eth: Client, client_uni: Client, bridge_params: dict, account_index: int) -> bool:
-        balance = await client_eth.w3.eth.get_balance(client_eth.wallet_address)
+        bridge_amount = await self.get_bridge_amount(client_eth, bridge_params, account_index)
+
+        if bridge_amount is False:
+            return False
+
+        return await self.execute_bridge(client_eth, client_uni, bridge_amount, account_index)
+
+    async def get_bridge_amount(self, client_eth: Client, bridge_params: dict, account_index: int) -> Union[bool, int]:
+        balance = await Manager.get_balance(client_eth)
         
         if not Manager.is_balance_sufficient(balance, bridge_params["min_balance"]):
             logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge cancelled: balance is less than minimum required.')
@@ -26,7 +39,7 @@ class BridgeManager:
             logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge cancelled: balance is less than amount to bridge.')
             return False
 
-        return await self.execute_bridge(client_eth, client_uni, bridge_amount, account_index)
+        return bridge_amount
     
     @staticmethod
     def calculate_bridge_amount(client_eth: Client, balance: int, bridge_params: dict, account_index: int) -> Union[bool, int]:
@@ -44,20 +57,41 @@ class BridgeManager:
     
     async def execute_bridge(self, client_eth: Client, client_uni: Client, bridge_amount: int, account_index: int) -> Optional[bool]:
         try:
-            bridge_fixed_amount = Utils.round_to_significant_digits(bridge_amount / 10 ** 18, 3)
-            
-            logger.info(f'Account {account_index+1} | {client_eth.wallet_address} | Attempting to bridge {bridge_fixed_amount} ETH...')
-            
-            result = await client_eth.bridge_eth(
-                contract_address='0xea58fcA6849d79EAd1f26608855c2D6407d54Ce2',
-                value=bridge_amount,
-                abi_path=ETHBRIDGE_ABI,
-                account_index=account_index
-            )
-
-            await Manager.wait_for_positive_balance(client_uni, account_index, BRIDGE_PARAMS['timeout'])
+            tx_hash = await self.submit_bridge(client_eth, client_uni, bridge_amount, account_index)
+            if not tx_hash:
+                return None
 
-            return result
+            return await self.confirm_bridge(client_eth, client_uni, tx_hash, account_index) is not False
         except Exception as e:
             logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Error during bridging ETH: {e}.')
             return False
+
+    async def submit_bridge(self, client_eth: Client, client_uni: Client, bridge_amount: int, account_index: int) -> Optional[str]:
+        bridge_fixed_amount = Utils.round_to_significant_digits(bridge_amount / 10 ** 18, 3)
+        logger.info(f'Account {account_index+1} | {client_eth.wallet_address} | Attempting to bridge {bridge_fixed_amount} ETH...')
+
+        deposit_watcher = deposit_watchers.get(client_uni.network)
+        deposit_watcher.watch(client_uni.wallet_address)
+        try:
+            tx_hash = await client_eth.send_bridge_eth(
+                contract_address=L1_STANDARD_BRIDGE,
+                value=bridge_amount,
+                abi_path=ETHBRIDGE_ABI
+            )
+        except Exception:
+            deposit_watcher.unwatch(client_uni.wallet_address)
+            raise
+
+        if not tx_hash:
+            deposit_watcher.unwatch(client_uni.wallet_address)
+        return tx_hash
+
+    async def confirm_bridge(self, client_eth: Client, client_uni: Client, tx_hash: str, account_index: int) -> Union[bool, int, None]:
+        try:
+            if not await client_eth.verif_tx(tx_hash, account_index):
+                return False
+            if simulator.enabled:
+                return simulator.get_receipt(tx_hash).value
+            return await Manager.wait_for_deposit(client_uni, account_index, BRIDGE_PARAMS['timeout'])
+        finally:
+            deposit_watchers.get(client_uni.network).unwatch(client_uni.wallet_address)
@@ -0,0 +1,102 @@
+import re
+from typing import Union
+
+from eth_abi import encode
+from hexbytes import HexBytes
+from eth_utils import function_abi_to_4byte_selector
+
+from src.artifacts import artifacts
+
+
+WORD_SIZE = 32
+
+PATCHABLE_TYPE = re.compile(r'^(address|bool|uint\d*)$')
+
+MORKIE_MINT_TEMPLATE = bytes.fromhex(
+    '84bb1e42'
+    '0000000000000000000000000000000000000000000000000000000000000000'
+    '0000000000000000000000000000000000000000000000000000000000000001'
+    '000000000000000000000000eeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee'
+    '0000000000000000000000000000000000000000000000000000000000000000'
+    '00000000000000000000000000000000000000000000000000000000000000c0'
+    '0000000000000000000000000000000000000000000000000000000000000160'
+    '0000000000000000000000000000000000000000000000000000000000000080'
+    '0000000000000000000000000000000000000000000000000000000000000000'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    '0000000000000000000000000000000000000000000000000000000000000000'
+    '0000000000000000000000000000000000000000000000000000000000000000'
+    '0000000000000000000000000000000000000000000000000000000000000000'
+)
+
+
+class CalldataTemplate:
+    def __init__(self, template: bytes, slots: tuple[tuple[int, str, int], ...] = ()) -> None:
+        self.buffer = bytearray(template)
+        self.slots = slots
+
+    @classmethod
+    def compile(cls, abi: list, method: str, args: tuple = ()) -> 'CalldataTemplate':
+        functions = [item for item in abi if item.get('type') == 'function' and item.get('name') == method and len(item['inputs']) == len(args)]
+        if len(functions) != 1:
+            raise ValueError(f'Cannot find a single function {method} with {len(args)} inputs in ABI')
+
+        function_abi = functions[0]
+        types = [item['type'] for item in function_abi['inputs']]
+        slots = []
+        offset = 4
+        sample_args = []
+
+        for arg_type, arg in zip(types, args):
+            if arg_type.startswith('tuple') or re.search(r'\[\d+\]$', arg_type):
+                raise ValueError(f'Unsupported input type {arg_type} in {method}')
+
+            if arg is None:
+                if not PATCHABLE_TYPE.match(arg_type):
+                    raise ValueError(f'Input type {arg_type} in {method} cannot be patched')
+                bits = 160 if arg_type == 'address' else 1 if arg_type == 'bool' else int(arg_type[4:] or 256)
+                slots.append((offset, arg_type, bits))
+                sample_args.append(False if arg_type == 'bool' else '0x' + '00' * 20 if arg_type == 'address' else 0)
+            elif arg_type.startswith('bytes') and isinstance(arg, str):
+                sample_args.append(bytes(HexBytes(arg)))
+            else:
+                sample_args.append(arg)
+            offset += WORD_SIZE
+
+        template = function_abi_to_4byte_selector(function_abi) + encode(types, sample_args)
+        return cls(template, tuple(slots))
+
+    def encode(self, *values: Union[str, int, bool]) -> str:
+        if len(values) != len(self.slots):
+            raise ValueError(f'Expected {len(self.slots)} values, got {len(values)}')
+
+        buffer = self.buffer
+        for (offset, arg_type, bits), value in zip(self.slots, values):
+            if arg_type == 'address':
+                address = bytes.fromhex(value[2:]) if isinstance(value, str) else bytes(value)
+                if len(address) != 20:
+                    raise ValueError(f'Invalid address: {value}')
+                buffer[offset:offset + 12] = bytes(12)
+                buffer[offset + 12:offset + WORD_SIZE] = address
+            else:
+                value = int(value)
+                if value < 0 or value >> bits:
+                    raise ValueError(f'Value {value} does not fit {arg_type}')
+                buffer[offset:offset + WORD_SIZE] = value.to_bytes(WORD_SIZE, 'big')
+        return '0x' + buffer.hex()
+
+
+class CalldataRegistry:
+    def __init__(self) -> None:
+        self.templates: dict[tuple[str, str, tuple], CalldataTemplate] = {}
+        self.morkie_mint = CalldataTemplate(MORKIE_MINT_TEMPLATE, ((4, 'address', 160),))
+
+    async def get(self, abi_path: str, method: str, args: tuple = ()) -> CalldataTemplate:
+        key = (abi_path, method, args)
+        template = self.templates.get(key)
+        if template is None:
+            template = CalldataTemplate.compile(await artifacts.get_abi(abi_path), method, args)
+            self.templates[key] = template
+        return template
+
+
+calldata_templates = CalldataRegistry()
@@ -1,40 +1,58 @@
-import asyncio
 import random
 from typing import Optional, Union
 
 from web3 import AsyncWeb3
+from web3.datastructures import AttributeDict
 from loguru import logger
 
-from src.utils import Utils
+from src.artifacts import artifacts
+from src.calldata import calldata_templates
+from src.providers import provider_pool
+from src.fees import fee_oracles
+from src.gas import GasEstimateCache, gas_estimates
+from src.nonce import NonceManager, nonce_managers
+from src.journal import journal
+from src.pipeline import tx_pipeline
+from src.receipts import receipt_trackers
+from src.simulation import simulator
+from src.wallets import Wallet
 from src.models import Network, TokenAmount
 
 
+MAX_NONCE_RESYNCS = 3
+
+
 class Client:
-    def __init__(self, private_key: str, network: Network, proxy: str = None):
+    __slots__ = ('private_key', 'network', 'proxy', 'w3', 'wallet_address', 'nonce_manager', 'fee_oracle', 'receipt_tracker')
+
+    def __init__(self, private_key: Union[str, bytes], network: Network, proxy: str = None, wallet_address: str = None):
         self.private_key = private_key
         self.network = network
         self.proxy = proxy
-        if proxy:
-            self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(endpoint_uri=self.network.rpc, request_kwargs={"proxy": f"http://{proxy}"}))
-        else:
-            self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(endpoint_uri=self.network.rpc))
-        self.wallet_address = AsyncWeb3.to_checksum_address(self.w3.eth.account.from_key(private_key).address)
-        self.nonce_lock = asyncio.Lock()
+        self.w3 = provider_pool.get_web3(self.network, proxy)
+        self.wallet_address = wallet_address or AsyncWeb3.to_checksum_address(self.w3.eth.account.from_key(private_key).address)
+        self.nonce_manager = nonce_managers.get(self.w3, self.network, self.wallet_address)
+        self.fee_oracle = fee_oracles.get(self.network)
+        self.receipt_tracker = receipt_trackers.get(self.network)
+
+    @classmethod
+    def from_wallet(cls, wallet: Wallet, network: Network) -> 'Client':
+        return cls(wallet.key, network, wallet.proxy, wallet_address=wallet.address)
 
     async def get_balance(self) -> int:
+        if simulator.balance_override is not None:
+            return simulator.balance_override
         return await self.w3.eth.get_balance(self.wallet_address)
 
     async def get_transaction_count(self) -> int:
-        async with self.nonce_lock:
-            return await self.w3.eth.get_transaction_count(self.wallet_address)
+        return await self.w3.eth.get_transaction_count(self.wallet_address, 'pending')
         
     async def send_transaction(self, to_: str = None, data: str = None, value: int = None, tx_params: dict = None) -> Optional[str]:
         if not tx_params:
             tx_params = {
                 'from': self.wallet_address,
-                'gasPrice': await self.w3.eth.gas_price,
-                'nonce': await self.get_transaction_count(),
-                'chainId': await self.w3.eth.chain_id
+                **await self.fee_oracle.get_fees(),
+                'chainId': self.network.chain_id
             }
 
             if to_:
@@ -47,50 +65,82 @@ class Client:
                 tx_params['value'] = value
 
             try:
-                estimate_gas = await self.w3.eth.estimate_gas(tx_params)
-                tx_params['gas'] = int(estimate_gas * 1.1)
+                tx_params['gas'] = await self.estimate_gas(tx_params)
             
             except Exception as e:
                 logger.warning(f'{self.wallet_address} | Error estimating gas: {e}')
                 return None
-        
-        else:
-            tx_params = tx_params
-        
-        try:
-            sign = self.w3.eth.account.sign_transaction(tx_params, self.private_key)
-            return await self.w3.eth.send_raw_transaction(sign.rawTransaction)
-        
-        except Exception as e:
-            if 'nonce too low' in str(e):
-                tx_params['nonce'] += 1
-                return await self.send_transaction(tx_params=tx_params)
-            elif 'replacement transaction underpriced' in str(e):
-                tx_params['nonce'] += 1
-                return await self.send_transaction(tx_params=tx_params)
-            elif 'already known' in str(e):
-                tx_params['nonce'] += 1
-                return await self.send_transaction(tx_params=tx_params)
+
+        if simulator.enabled:
+            return await simulator.simulate(self, tx_params)
+
+        if 'nonce' not in tx_params:
+            tx_params['nonce'] = await self.nonce_manager.allocate()
+
+        for _ in range(MAX_NONCE_RESYNCS):
+            try:
+                tx_hash = await tx_pipeline.submit(self.w3, tx_params, self.private_key)
+                journal.record_sent(self.network, tx_hash, tx_params['nonce'])
+                return tx_hash
             
-            logger.warning(f'{self.wallet_address} | Error sending transaction: {e}')
-            return None
+            except Exception as e:
+                if GasEstimateCache.is_gas_error(e) and gas_estimates.invalidate(self.network, tx_params):
+                    logger.debug(f'{self.wallet_address} | Cached gas limit rejected, estimating live: {e}')
+                    try:
+                        tx_params['gas'] = await self.estimate_gas(tx_params)
+                        continue
+                    except Exception as estimate_error:
+                        e = estimate_error
+
+                if not NonceManager.is_nonce_error(e):
+                    self.nonce_manager.release(tx_params['nonce'])
+                    logger.warning(f'{self.wallet_address} | Error sending transaction: {e}')
+                    return None
 
-    async def send_transaction_with_abimethod(self, contract, method: str, *args, value: Optional[int] = None) -> Optional[str]:
+                logger.debug(f'{self.wallet_address} | Nonce {tx_params["nonce"]} rejected, resyncing: {e}')
+                await self.nonce_manager.resync()
+                tx_params['nonce'] = await self.nonce_manager.allocate()
+
+        logger.warning(f'{self.wallet_address} | Error sending transaction: nonce rejected {MAX_NONCE_RESYNCS} times.')
+        return None
+
+    async def estimate_gas(self, tx_params: dict, increase_gas: float = 1.1, cacheable: bool = False) -> int:
+        if cacheable:
+            cached_gas = gas_estimates.get(self.network, tx_params)
+            if cached_gas:
+                return cached_gas
+
+        estimate_params = {key: value for key, value in tx_params.items() if key != 'gas'}
+        if simulator.enabled:
+            estimate_gas = await simulator.estimate_gas(self, estimate_params)
+        else:
+            estimate_gas = await self.w3.eth.estimate_gas(estimate_params)
+
+        if cacheable:
+            gas_estimates.put(self.network, tx_params, estimate_gas)
+        return int(estimate_gas * increase_gas)
+
+    async def send_transaction_with_abimethod(self, contract, method: str, *args, value: Optional[int] = None, cacheable_gas: bool = False) -> Optional[str]:
+        return await self.send_transaction_with_calldata(contract.address, contract.encode_abi(method, args=args), value=value, cacheable_gas=cacheable_gas)
+
+    async def send_transaction_with_template(self, contract_address: str, abi_path: str, method: str, template_args: tuple, *values, value: Optional[int] = None, cacheable_gas: bool = False) -> Optional[str]:
+        template = await calldata_templates.get(abi_path, method, template_args)
+        return await self.send_transaction_with_calldata(AsyncWeb3.to_checksum_address(contract_address), template.encode(*values), value=value, cacheable_gas=cacheable_gas)
+
+    async def send_transaction_with_calldata(self, contract_address: str, data: str, value: Optional[int] = None, cacheable_gas: bool = False) -> Optional[str]:
         tx_params = {
-            'to': contract.address,
+            'to': contract_address,
             'from': self.wallet_address,
-            'data': contract.encode_abi(method, args=args),
-            'gasPrice': await self.w3.eth.gas_price,
-            'nonce': await self.get_transaction_count(),
-            'chainId': await self.w3.eth.chain_id
+            'data': data,
+            **await self.fee_oracle.get_fees(),
+            'chainId': self.network.chain_id
         }
         
         if value:
             tx_params['value'] = value
         
         try:
-            estimate_gas = await self.w3.eth.estimate_gas(tx_params)
-            tx_params['gas'] = int(estimate_gas * 1.1) 
+            tx_params['gas'] = await self.estimate_gas(tx_params, cacheable=cacheable_gas)
         
         except Exception as e:
             logger.warning(f'{self.wallet_address} | Error estimating gas: {e}')
@@ -98,12 +148,11 @@ class Client:
         
         return await self.send_transaction(tx_params=tx_params)
 
-    async def bridge_eth(self, contract_address: str, value: Union[TokenAmount, int], abi_path: str, account_index: int) -> Optional[bool]:       
-        args = [self.wallet_address, 200000, '0x7375706572627269646765']
-        bridge_abi = await Utils.read_json(abi_path)
-        contract = self.w3.eth.contract(address=AsyncWeb3.to_checksum_address(contract_address), abi=bridge_abi)
+    async def send_bridge_eth(self, contract_address: str, value: Union[TokenAmount, int], abi_path: str) -> Optional[str]:
+        return await self.send_transaction_with_template(contract_address, abi_path, 'bridgeETHTo', (None, 200000, '0x7375706572627269646765'), self.wallet_address, value=value)
 
-        tx = await self.send_transaction_with_abimethod(contract, 'bridgeETHTo', *args, value=value)
+    async def bridge_eth(self, contract_address: str, value: Union[TokenAmount, int], abi_path: str, account_index: int) -> Optional[bool]:       
+        tx = await self.send_bridge_eth(contract_address, value, abi_path)
         if tx:
             await self.verif_tx(tx, account_index)
             return True
@@ -114,58 +163,46 @@ class Client:
             logger.warning(f'{self.wallet_address} | Wrap cancelled: balance is less than amount to wrap.')
             return None
 
-        weth_abi = await Utils.read_json(abi_path)
-        contract = self.w3.eth.contract(address=AsyncWeb3.to_checksum_address(contract_address), abi=weth_abi)
-
-        tx = await self.send_transaction_with_abimethod(contract=contract, method='deposit', value=value)
+        tx = await self.send_transaction_with_template(contract_address, abi_path, 'deposit', (), value=value)
         if tx:
             await self.verif_tx(tx, account_index)
             return True
 
     async def deploy_contract(self, account_index: int, name: str, symbol: str, abi_path: str, bytecode_path: str, increase_gas: float = 1.1) -> Optional[str]:
-        contract_abi = await Utils.read_json(abi_path)
-        contract_bytecode = await Utils.read_file(bytecode_path)
-        contract = self.w3.eth.contract(abi=contract_abi, bytecode=contract_bytecode)
+        contract = await artifacts.get_contract(self.w3, abi_path, bytecode_path=bytecode_path)
 
         tx_params = {
-            'chainId': await self.w3.eth.chain_id,
+            'chainId': self.network.chain_id,
             'from': self.wallet_address,
-            'nonce': await self.get_transaction_count(),
-            'gasPrice': await self.w3.eth.gas_price
+            'data': contract.constructor(name, symbol).data_in_transaction,
+            **await self.fee_oracle.get_fees()
         }
 
         try:
-            estimate_gas = await contract.constructor(name, symbol).estimate_gas({'from': self.wallet_address})
-            tx_params['gas'] = int(estimate_gas * increase_gas)
+            tx_params['gas'] = await self.estimate_gas(tx_params, increase_gas=increase_gas, cacheable=True)
         
         except Exception as e:
             logger.warning(f'{self.wallet_address} | Error estimating gas: {e}')
             return None
 
-        construct_tx = await contract.constructor(name, symbol).build_transaction(tx_params)
-        tx = await self.send_transaction(tx_params=construct_tx)
+        tx = await self.send_transaction(tx_params=tx_params)
 
         if tx:
-            if await self.verif_tx(tx, account_index):
-                tx_receipt = await self.w3.eth.wait_for_transaction_receipt(tx, timeout=200)
+            tx_receipt = await self.wait_for_successful_receipt(tx, account_index)
+            if tx_receipt:
                 return tx_receipt.contractAddress
             
+            gas_estimates.invalidate(self.network, tx_params)
             logger.warning(f'{self.wallet_address} | Contract deployment failed.')
             return None
 
     async def mint_nft(self, contract_address: str, abi_path: str, account_index: int) -> Optional[bool]:
-        contract_abi = await Utils.read_json(abi_path)
-        contract = self.w3.eth.contract(address=AsyncWeb3.to_checksum_address(contract_address), abi=contract_abi)
-
-        tx = await self.send_transaction_with_abimethod(contract, 'createCollectible')
+        tx = await self.send_transaction_with_template(contract_address, abi_path, 'createCollectible', ())
         if tx:
             return await self.verif_tx(tx, account_index)
         return None
 
     async def random_interact_with_contract(self, contract_address: str, abi_path: str, account_index: int) -> Optional[bool]:
-        contract_abi = await Utils.read_json(abi_path)
-        contract = self.w3.eth.contract(address=AsyncWeb3.to_checksum_address(contract_address), abi=contract_abi)
-
         values = [10000, 50000, 100000, 250000, 500000, 1000000]
         available_methods = ['mint', 'burn', 'pause']
         args = []
@@ -179,31 +216,29 @@ class Client:
             random_value = random.choice(values)
             args = [random_value * 10 ** 18]
         
-        tx = await self.send_transaction_with_abimethod(contract, random_method, *args)
+        tx = await self.send_transaction_with_template(contract_address, abi_path, random_method, (None,) * len(args), *args)
         
         if tx:
             return await self.verif_tx(tx, account_index)
         return None
 
     async def mint_morkie_nft(self, contract_address: str, account_index: int) -> Optional[bool]:
-        formatted_address = self.wallet_address.lower().replace('0x', '')
-
         tx_params = {
-            'chainId': await self.w3.eth.chain_id,
-            'data': f'0x84bb1e42000000000000000000000000{formatted_address}0000000000000000000000000000000000000000000000000000000000000001000000000000000000000000eeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000c0000000000000000000000000000000000000000000000000000000000000016000000000000000000000000000000000000000000000000000000000000000800000000000000000000000000000000000000000000000000000000000000000ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000',
+            'chainId': self.network.chain_id,
+            'data': calldata_templates.morkie_mint.encode(self.wallet_address),
             'from': self.wallet_address,
             'to': contract_address,
-            'nonce': await self.get_transaction_count(),
-            'gasPrice': await self.w3.eth.gas_price,
+            **await self.fee_oracle.get_fees(),
             'value': 0
         }
 
         try:
-            gas_estimate = await self.w3.eth.estimate_gas(tx_params)
-            tx_params['gas'] = int(gas_estimate * 1.1)
+            tx_params['gas'] = await self.estimate_gas(tx_params)
         except Exception as e:
             if '2' in str(e):
                 logger.info(f'Account {account_index+1} | {self.wallet_address} | Already have NFT from morkie.xyz')
+                if simulator.enabled:
+                    simulator.mark(e, 'already_minted')
             else:
                 logger.error(f'Account {account_index+1} | {self.wallet_address} | Error estimating gas: {e}')
             return None
@@ -214,14 +249,20 @@ class Client:
         return None
         
     async def verif_tx(self, tx_hash: str, account_index: int) -> bool:
+        return await self.wait_for_successful_receipt(tx_hash, account_index) is not None
+
+    async def wait_for_successful_receipt(self, tx_hash: str, account_index: int) -> Optional[AttributeDict]:
+        if simulator.enabled:
+            return simulator.get_receipt(tx_hash)
+
         try:
-            data = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=200)
+            data = await self.receipt_tracker.wait_for_receipt(tx_hash, timeout=200)
             if data.get('status') == 1:
                 logger.debug(f'Account {account_index+1} | {self.wallet_address} | Successful tx: {self.network.explorer}/tx/{tx_hash.hex()}')
-                return True 
+                return data
             else:
                 logger.warning(f'Account {account_index+1} | {self.wallet_address} | Failed tx: {self.network.explorer}/tx/{data["transactionHash"].hex()}')
-                return False
+                return None
         except Exception as e:
             logger.warning(f'Account {account_index+1} | {self.wallet_address} | Unexpected error in <verif_tx> function: {e}')
-            return False
+            return None
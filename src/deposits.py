@@ -0,0 +1,102 @@
+import asyncio
+from typing import Optional
+
+from web3 import Web3
+
+from src.models import Network
+from src.blocks import BlockTracker, block_trackers
+from src.providers import provider_pool
+
+
+L2_STANDARD_BRIDGE = '0x4200000000000000000000000000000000000010'
+
+ETH_BRIDGE_FINALIZED_TOPIC = Web3.keccak(text='ETHBridgeFinalized(address,address,uint256,bytes)').hex()
+
+MAX_LOG_RANGE = 1000
+
+MAX_TOPIC_ADDRESSES = 100
+
+
+class DepositWatcher:
+    def __init__(self, network: Network, tracker: BlockTracker, bridge_address: str = L2_STANDARD_BRIDGE) -> None:
+        self.network = network
+        self.tracker = tracker
+        self.bridge_address = bridge_address
+        self.pending: dict[str, asyncio.Future] = {}
+        self.scanned_block: Optional[int] = None
+        self.tracker.subscribe(self.on_block)
+
+    @staticmethod
+    def to_topic(address: str) -> str:
+        return '0x' + '00' * 12 + address[2:].lower()
+
+    def watch(self, wallet_address: str) -> asyncio.Future:
+        key = wallet_address.lower()
+        future = self.pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.pending[key] = future
+            if len(self.pending) == 1:
+                self.scanned_block = self.tracker.block_number
+            self.tracker.hold()
+        return future
+
+    def unwatch(self, wallet_address: str) -> None:
+        future = self.pending.pop(wallet_address.lower(), None)
+        if future is not None:
+            future.cancel()
+            self.tracker.release()
+
+    async def wait_for_deposit(self, wallet_address: str, timeout: float) -> Optional[int]:
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.watch(wallet_address)), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self.unwatch(wallet_address)
+
+    async def on_block(self, block_number: int) -> None:
+        if not self.pending:
+            self.scanned_block = block_number
+            return
+
+        from_block = block_number if self.scanned_block is None else self.scanned_block + 1
+        while from_block <= block_number:
+            to_block = min(block_number, from_block + MAX_LOG_RANGE - 1)
+            await self.scan(from_block, to_block)
+            self.scanned_block = to_block
+            from_block = to_block + 1
+
+    async def scan(self, from_block: int, to_block: int) -> None:
+        topics = [ETH_BRIDGE_FINALIZED_TOPIC]
+        if len(self.pending) <= MAX_TOPIC_ADDRESSES:
+            topics += [None, [self.to_topic(address) for address in self.pending]]
+
+        w3 = provider_pool.get_web3(self.network)
+        logs = await w3.eth.get_logs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': self.bridge_address,
+            'topics': topics
+        })
+
+        for log in logs:
+            wallet_address = '0x' + bytes(log['topics'][2])[-20:].hex()
+            future = self.pending.get(wallet_address)
+            if future is not None and not future.done():
+                future.set_result(int.from_bytes(bytes(log['data'])[:32], 'big'))
+
+
+class DepositWatcherRegistry:
+    def __init__(self) -> None:
+        self.watchers: dict[str, DepositWatcher] = {}
+
+    def get(self, network: Network) -> DepositWatcher:
+        watcher = self.watchers.get(network.name)
+        if watcher is None:
+            watcher = DepositWatcher(network, block_trackers.get(network))
+            self.watchers[network.name] = watcher
+        return watcher
+
+
+deposit_watchers = DepositWatcherRegistry()
@@ -4,12 +4,13 @@ from loguru import logger
 
 from src.utils import Utils
 from src.client import Client
+from src.manager import Manager
 from src.vars import ERC721_ABI, ERC721_BYTECODE
 
 
 class ERC721Manager:
     async def deploy_erc721(self, client_uni: Client, name: str, symbol: str, account_index: int, is_first_tx: bool = False) -> Union[bool, str]:
-        balance = await client_uni.w3.eth.get_balance(client_uni.wallet_address)
+        balance = await Manager.get_balance(client_uni)
         
         if balance <= 0:
             logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Deploy cancelled: zero balance.')
@@ -40,7 +41,7 @@ class ERC721Manager:
             return False
 
     async def mint_nft(self, client_uni: Client, contract_address: str, account_index: int) -> bool:
-        balance = await client_uni.w3.eth.get_balance(client_uni.wallet_address)
+        balance = await Manager.get_balance(client_uni)
         
         if balance <= 0:
             logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Mint cancelled: zero balance.')
@@ -0,0 +1,93 @@
+import time
+import asyncio
+from typing import Optional
+
+from loguru import logger
+
+from src.models import Network
+from config import FEE_PARAMS
+from src.providers import provider_pool
+
+
+UNSUPPORTED_ERRORS = ('-32601', 'method not found', 'not supported', 'unsupported', 'not available', 'does not exist')
+
+
+class FeeOracle:
+    def __init__(self, network: Network, fee_params: dict = FEE_PARAMS) -> None:
+        self.network = network
+        self.fee_params = fee_params
+        self.eip1559 = fee_params['eip1559']
+        self.lock = asyncio.Lock()
+        self.fees: Optional[dict] = None
+        self.updated_at: Optional[float] = None
+        self.refreshes = 0
+
+    def is_stale(self) -> bool:
+        return self.fees is None or self.updated_at is None or time.monotonic() - self.updated_at > self.fee_params['ttl']
+
+    async def get_fees(self) -> dict:
+        if self.is_stale():
+            async with self.lock:
+                if self.is_stale():
+                    await self.refresh()
+        return dict(self.fees)
+
+    def invalidate(self) -> None:
+        self.updated_at = None
+
+    async def refresh(self) -> None:
+        w3 = provider_pool.get_web3(self.network)
+
+        if self.eip1559:
+            try:
+                self.fees = await self.fetch_eip1559_fees(w3)
+            except Exception as e:
+                if not self.is_unsupported(e):
+                    if self.fees is None:
+                        raise
+                    logger.warning(f'{self.network.name} | eth_feeHistory failed, keeping the last fees until the next refresh: {e}')
+                    return
+                logger.warning(f'{self.network.name} | eth_feeHistory is not supported, falling back to legacy gas price: {e}')
+                self.eip1559 = False
+
+        if not self.eip1559:
+            self.fees = {'gasPrice': await w3.eth.gas_price}
+
+        self.updated_at = time.monotonic()
+        self.refreshes += 1
+
+    @staticmethod
+    def is_unsupported(error: Exception) -> bool:
+        message = str(error).lower()
+        return any(text in message for text in UNSUPPORTED_ERRORS)
+
+    async def fetch_eip1559_fees(self, w3) -> dict:
+        history = await w3.eth.fee_history(
+            self.fee_params['history_blocks'], 'latest', [self.fee_params['reward_percentile']]
+        )
+        if not history['baseFeePerGas']:
+            raise ValueError('eth_feeHistory returned no blocks: not supported by this RPC')
+        next_base_fee = history['baseFeePerGas'][-1]
+        rewards = sorted(reward[0] for reward in history['reward'] if reward)
+        priority_fee = rewards[len(rewards) // 2] if rewards else 0
+        priority_fee = max(priority_fee, int(self.fee_params['min_priority_fee_gwei'] * 10 ** 9))
+
+        return {
+            'maxFeePerGas': int(next_base_fee * self.fee_params['base_fee_multiplier']) + priority_fee,
+            'maxPriorityFeePerGas': priority_fee
+        }
+
+
+class FeeOracleRegistry:
+    def __init__(self) -> None:
+        self.oracles: dict[str, FeeOracle] = {}
+
+    def get(self, network: Network) -> FeeOracle:
+        oracle = self.oracles.get(network.name)
+        if oracle is None:
+            oracle = FeeOracle(network)
+            self.oracles[network.name] = oracle
+        return oracle
+
+
+fee_oracles = FeeOracleRegistry()
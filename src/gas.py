@@ -0,0 +1,79 @@
+import time
+from typing import Optional, Union
+
+from src.models import Network
+from config import GAS_CACHE_PARAMS
+
+
+GAS_ERRORS = ('intrinsic gas too low', 'out of gas', 'gas limit reached', 'gas required exceeds')
+
+
+class GasEstimateCache:
+    def __init__(self, gas_params: dict = GAS_CACHE_PARAMS) -> None:
+        self.gas_params = gas_params
+        self.entries: dict[tuple, tuple[int, float, Optional[int]]] = {}
+        self.current_blocks: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(network: Network, tx_params: dict) -> tuple:
+        data: Union[str, bytes] = tx_params.get('data') or b''
+        if isinstance(data, str):
+            data = bytes.fromhex(data.removeprefix('0x'))
+
+        to_ = tx_params.get('to')
+        selector = data[:4].hex() if to_ else ''
+        length_class = (len(data) + 31) // 32
+
+        return network.name, to_.lower() if to_ else None, selector, length_class, bool(tx_params.get('value'))
+
+    def on_new_block(self, network: Network, block_number: int) -> None:
+        self.current_blocks[network.name] = block_number
+
+    def is_expired(self, network: Network, created_at: float, created_block: Optional[int]) -> bool:
+        if time.monotonic() - created_at > self.gas_params['ttl']:
+            return True
+        current_block = self.current_blocks.get(network.name)
+        if created_block is not None and current_block is not None:
+            return current_block - created_block > self.gas_params['max_blocks']
+        return False
+
+    def get(self, network: Network, tx_params: dict) -> Optional[int]:
+        if not self.gas_params['enabled']:
+            return None
+
+        key = self.make_key(network, tx_params)
+        entry = self.entries.get(key)
+
+        if entry is None or self.is_expired(network, entry[1], entry[2]):
+            self.entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return int(entry[0] * self.gas_params['multiplier'])
+
+    def put(self, network: Network, tx_params: dict, estimate: int) -> None:
+        if self.gas_params['enabled']:
+            key = self.make_key(network, tx_params)
+            self.entries[key] = (estimate, time.monotonic(), self.current_blocks.get(network.name))
+
+    def invalidate(self, network: Network, tx_params: dict) -> bool:
+        return self.entries.pop(self.make_key(network, tx_params), None) is not None
+
+    @staticmethod
+    def is_gas_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return any(text in message for text in GAS_ERRORS)
+
+    def stats(self) -> dict[str, Union[int, float]]:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0
+        }
+
+
+gas_estimates = GasEstimateCache()
@@ -0,0 +1,218 @@
+import time
+import sqlite3
+import asyncio
+import contextlib
+from contextvars import ContextVar
+from typing import Any, Coroutine, Optional, Union
+
+import ujson
+from hexbytes import HexBytes
+from loguru import logger
+
+from src.vars import JOURNAL_PATH
+from src.providers import provider_pool
+from src.models import ethereum_sepolia, unichain_sepolia, Network
+
+
+RECONCILE_CHUNK_SIZE = 100
+
+RECONCILE_INTERVAL = 10
+
+RECONCILE_TIMEOUT = 180
+
+NETWORKS = {network.name: network for network in (ethereum_sepolia, unichain_sepolia)}
+
+current_step: ContextVar[Optional[tuple[str, str]]] = ContextVar('current_step', default=None)
+
+
+class Journal:
+    def __init__(self, path: str = JOURNAL_PATH) -> None:
+        self.path = path
+        self.connection: Optional[sqlite3.Connection] = None
+        self.run_id: Optional[str] = None
+        self.resume = False
+        self.steps: dict[tuple[str, str], tuple[str, Optional[str], Optional[str], Optional[str], Optional[int]]] = {}
+
+    def open(self, resume: bool = False) -> None:
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS steps (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                wallet TEXT NOT NULL,
+                action TEXT NOT NULL,
+                status TEXT NOT NULL,
+                network TEXT,
+                tx_hash TEXT,
+                result TEXT,
+                nonce INTEGER,
+                created_at REAL NOT NULL
+            )
+        ''')
+        columns = [row[1] for row in self.connection.execute('PRAGMA table_info(steps)')]
+        if 'nonce' not in columns:
+            self.connection.execute('ALTER TABLE steps ADD COLUMN nonce INTEGER')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS steps_run ON steps (run_id, wallet, action)')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS run_meta (
+                run_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (run_id, key)
+            )
+        ''')
+
+        last_run = self.connection.execute('SELECT run_id FROM steps ORDER BY id DESC LIMIT 1').fetchone()
+        if resume and last_run:
+            self.run_id = last_run[0]
+            self.resume = True
+            for wallet, action, status, network, tx_hash, result, nonce in self.connection.execute(
+                'SELECT wallet, action, status, network, tx_hash, result, nonce FROM steps WHERE run_id = ? ORDER BY id', (self.run_id,)
+            ):
+                self.steps[(wallet, action)] = (status, network, tx_hash, result, nonce)
+            logger.info(f'Resuming run {self.run_id}: {len(self.steps)} journaled steps loaded.')
+        else:
+            if resume:
+                logger.warning('Nothing to resume: journal is empty. Starting a new run.')
+            self.run_id = time.strftime('%Y%m%d_%H%M%S')
+
+    def close(self) -> None:
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+    def remember(self, key: str, value: Any) -> Any:
+        if self.connection is None:
+            return value
+
+        row = self.connection.execute('SELECT value FROM run_meta WHERE run_id = ? AND key = ?', (self.run_id, key)).fetchone()
+        if row:
+            return ujson.loads(row[0])
+
+        self.connection.execute('INSERT INTO run_meta (run_id, key, value) VALUES (?, ?, ?)', (self.run_id, key, ujson.dumps(value)))
+        self.connection.commit()
+        return value
+
+    def record(self, wallet: str, action: str, status: str, network: Optional[Network] = None, tx_hash: Optional[str] = None, result: Optional[str] = None, nonce: Optional[int] = None) -> None:
+        if self.connection is None:
+            return
+
+        network_name = network.name if network else None
+        if network_name is None and (wallet, action) in self.steps:
+            _, network_name, previous_tx_hash, _, previous_nonce = self.steps[(wallet, action)]
+            tx_hash = tx_hash or previous_tx_hash
+            nonce = nonce if nonce is not None else previous_nonce
+
+        self.steps[(wallet, action)] = (status, network_name, tx_hash, result, nonce)
+        self.connection.execute(
+            'INSERT INTO steps (run_id, wallet, action, status, network, tx_hash, result, nonce, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (self.run_id, wallet, action, status, network_name, tx_hash, result, nonce, time.time())
+        )
+        self.connection.commit()
+
+    def record_sent(self, network: Network, tx_hash: Union[str, bytes], nonce: Optional[int] = None) -> None:
+        step = current_step.get()
+        if step:
+            self.record(*step, 'pending', network=network, tx_hash='0x' + bytes(HexBytes(tx_hash)).hex(), nonce=nonce)
+
+    def is_done(self, wallet: str, action: str) -> bool:
+        step = self.steps.get((wallet, action))
+        return self.resume and step is not None and step[0] == 'success'
+
+    def is_pending(self, wallet: str, action: str) -> bool:
+        step = self.steps.get((wallet, action))
+        return self.resume and step is not None and step[0] == 'pending' and step[2] is not None
+
+    def get_result(self, wallet: str, action: str) -> Optional[str]:
+        step = self.steps.get((wallet, action))
+        return step[3] if step else None
+
+    @contextlib.contextmanager
+    def step(self, wallet: str, action: str):
+        token = current_step.set((wallet, action))
+        try:
+            yield
+        finally:
+            current_step.reset(token)
+
+    async def run_step(self, wallet: str, action: str, coroutine: Coroutine) -> Any:
+        if self.is_done(wallet, action):
+            coroutine.close()
+            result = self.get_result(wallet, action)
+            logger.info(f'{wallet} | Skipping {action}: already completed in run {self.run_id}.')
+            return result if result is not None else True
+
+        if self.is_pending(wallet, action):
+            coroutine.close()
+            logger.warning(f'{wallet} | Skipping {action}: its transaction {self.steps[(wallet, action)][2]} is still pending, run --resume again once it is mined or dropped.')
+            return None
+
+        with self.step(wallet, action):
+            result = await coroutine
+
+        status = 'success' if result and not isinstance(result, Exception) else 'failed'
+        self.record(wallet, action, status, result=result if isinstance(result, str) else None)
+        return result
+
+    async def reconcile(self) -> None:
+        pending = [
+            (wallet, action, network_name, tx_hash, nonce)
+            for (wallet, action), (status, network_name, tx_hash, _, nonce) in self.steps.items()
+            if status == 'pending' and tx_hash and network_name in NETWORKS
+        ]
+        if not pending:
+            return
+
+        logger.info(f'Checking {len(pending)} pending journaled transactions against receipts...')
+        deadline = time.monotonic() + RECONCILE_TIMEOUT
+        while True:
+            still_pending = []
+            for network_name, network in NETWORKS.items():
+                network_pending = [step for step in pending if step[2] == network_name]
+                if network_pending:
+                    still_pending += await self.reconcile_network(network, network_pending)
+
+            pending = still_pending
+            if not pending or time.monotonic() > deadline:
+                break
+            logger.info(f'{len(pending)} journaled transactions are still pending, checking again in {RECONCILE_INTERVAL} seconds...')
+            await asyncio.sleep(RECONCILE_INTERVAL)
+
+        if pending:
+            logger.warning(f'{len(pending)} journaled transactions are still pending after {RECONCILE_TIMEOUT} seconds, their steps will not be re-run.')
+
+    async def reconcile_network(self, network: Network, steps: list[tuple]) -> list[tuple]:
+        provider = provider_pool.get_web3(network).provider
+        wallets = list({step[0] for step in steps})
+        nonces = {}
+        for i in range(0, len(wallets), RECONCILE_CHUNK_SIZE):
+            chunk = wallets[i:i + RECONCILE_CHUNK_SIZE]
+            responses = await provider.make_batch_request([('eth_getTransactionCount', [wallet, 'latest']) for wallet in chunk])
+            nonces.update((wallet, int(response['result'], 16)) for wallet, response in zip(chunk, responses) if response.get('result'))
+
+        still_pending = []
+        for i in range(0, len(steps), RECONCILE_CHUNK_SIZE):
+            chunk = steps[i:i + RECONCILE_CHUNK_SIZE]
+            responses = await provider.make_batch_request(
+                [('eth_getTransactionReceipt', [step[3]]) for step in chunk] + [('eth_getTransactionByHash', [step[3]]) for step in chunk]
+            )
+
+            for (wallet, action, network_name, tx_hash, nonce), receipt_response, transaction_response in zip(chunk, responses, responses[len(chunk):]):
+                receipt = receipt_response.get('result')
+                if receipt:
+                    status = 'success' if int(receipt['status'], 16) == 1 else 'failed'
+                    self.record(wallet, action, status, result=receipt.get('contractAddress') if status == 'success' else None)
+                elif transaction_response.get('result') or 'error' in receipt_response or 'error' in transaction_response or wallet not in nonces:
+                    still_pending.append((wallet, action, network_name, tx_hash, nonce))
+                elif nonce is not None and nonces[wallet] > nonce:
+                    logger.warning(f'{wallet} | Nonce {nonce} of {action} was used by another transaction, {tx_hash} will never be mined. The step will be re-run.')
+                    self.record(wallet, action, 'failed')
+                else:
+                    logger.info(f'{wallet} | Transaction {tx_hash} of {action} was dropped, the step will be re-run.')
+                    self.record(wallet, action, 'unconfirmed')
+        return still_pending
+
+
+journal = Journal()
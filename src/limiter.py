@@ -0,0 +1,73 @@
+import time
+import asyncio
+import contextlib
+from typing import Optional
+
+from loguru import logger
+
+from config import LIMITER_PARAMS
+
+
+class AdaptiveLimiter:
+    def __init__(self, name: str, limiter_params: dict = LIMITER_PARAMS) -> None:
+        self.name = name
+        self.limiter_params = limiter_params
+        self.limit = float(limiter_params['initial_limit'])
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.backoff_streak = 0
+        self.condition = asyncio.Condition()
+        self.rate_limited = 0
+
+    async def acquire(self) -> None:
+        async with self.condition:
+            while True:
+                delay = self.paused_until - time.monotonic()
+                if delay > 0:
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self.condition.wait(), delay)
+                    continue
+
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                await self.condition.wait()
+
+    async def release(self, error_class: Optional[str] = None) -> None:
+        async with self.condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+
+            if error_class == 'rate_limited':
+                self.rate_limited += 1
+                if now >= self.paused_until:
+                    self.limit = max(self.limiter_params['min_limit'], self.limit * self.limiter_params['decrease'])
+                    backoff = min(self.limiter_params['backoff'] * 2 ** self.backoff_streak, self.limiter_params['max_backoff'])
+                    self.backoff_streak += 1
+                    self.paused_until = now + backoff
+                    logger.warning(f'{self.name} | Rate limited, pausing for {backoff}s and lowering concurrency to {int(self.limit)}.')
+            elif not error_class:
+                self.backoff_streak = 0
+                self.limit = min(self.limiter_params['max_limit'], self.limit + self.limiter_params['increase'] / self.limit)
+
+            self.condition.notify_all()
+
+    def stats(self) -> str:
+        return f'{self.name} concurrency {int(self.limit)}, {self.rate_limited} rate limited'
+
+
+class LimiterRegistry:
+    def __init__(self) -> None:
+        self.limiters: dict[tuple[str, Optional[str]], AdaptiveLimiter] = {}
+
+    def get(self, uri: str, proxy: Optional[str] = None) -> AdaptiveLimiter:
+        key = (uri, proxy)
+        limiter = self.limiters.get(key)
+        if limiter is None:
+            name = f'{uri} via {proxy.rsplit("@", 1)[-1]}' if proxy else uri
+            limiter = AdaptiveLimiter(name)
+            self.limiters[key] = limiter
+        return limiter
+
+
+rpc_limiters = LimiterRegistry()
@@ -1,6 +1,4 @@
-import time
 import random
-import asyncio
 from decimal import Decimal
 from typing import Optional, Union
 
@@ -8,25 +6,29 @@ from loguru import logger
 
 from src.utils import Utils
 from src.client import Client
+from src.snapshot import balance_snapshot
+from src.deposits import deposit_watchers
+from src.simulation import simulator
 
 
 class Manager:
     @staticmethod
-    async def wait_for_positive_balance(client: Client, account_index: int, timeout: int) -> bool:
-        start_time = time.time()
-        while True:
+    async def get_balance(client: Client) -> int:
+        balance = balance_snapshot.pop_balance(client.network, client.wallet_address)
+        if balance is None or simulator.balance_override is not None:
             balance = await client.get_balance()
-            
-            if balance > 0:
-                logger.info(f'Account {account_index+1} | {client.wallet_address} | Balance is positive: {balance / 10 ** 18} ETH.')
-                return True
-            
-            if time.time() - start_time > timeout:
-                logger.error(f'Account {account_index+1} | {client.wallet_address} | Error: Timeout waiting for positive balance after {timeout} seconds.')
-                return False
-            
-            logger.info(f'Account {account_index+1} | {client.wallet_address} | Waiting for positive balance in {client.network.name}...')
-            await asyncio.sleep(10)
+        return balance
+
+    @staticmethod
+    async def wait_for_deposit(client: Client, account_index: int, timeout: int) -> Optional[int]:
+        logger.info(f'Account {account_index+1} | {client.wallet_address} | Waiting for deposit in {client.network.name}...')
+        amount = await deposit_watchers.get(client.network).wait_for_deposit(client.wallet_address, timeout)
+
+        if amount is None:
+            logger.error(f'Account {account_index+1} | {client.wallet_address} | Error: Timeout waiting for deposit after {timeout} seconds.')
+        else:
+            logger.info(f'Account {account_index+1} | {client.wallet_address} | Deposit of {amount / 10 ** 18} ETH arrived in {client.network.name}.')
+        return amount
 
     @staticmethod
     def is_balance_sufficient(balance: int, min_balance: Union[bool, float]) -> bool:
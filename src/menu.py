@@ -1,14 +1,18 @@
-import random
 import asyncio
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Optional
 
 from loguru import logger
 
-from src.utils import Utils
 from src.client import Client
-from src.vars import NAMES_PATH, SYMBOLS_PATH
+from src.journal import journal
+from src.names import name_pool
+from src.nonce import nonce_managers
+from src.providers import provider_pool
+from src.scheduler import AccountScheduler
+from src.wallets import Wallet, WalletSource
+from src.snapshot import balance_snapshot
 from src.models import ethereum_sepolia, unichain_sepolia
-from config import BRIDGE_PARAMS, DELAY_BETWEEN_ACC, WRAP_PARAMS, SHUFFLE_WALLETS
+from config import BRIDGE_PARAMS, WRAP_PARAMS, SNAPSHOT_PARAMS, SCHEDULER_PARAMS
 
 from src.wrap import WrapManager
 from src.erc_20 import ERC20Manager
@@ -18,6 +22,15 @@ from src.erc_721 import ERC721Manager
 from src.random_interactions import RandomManager
 
 
+FOLLOW_UP_CHOICES = {
+    'wrap': 2,
+    'erc721': 3,
+    'erc20': 4,
+    'morkie_unicorn': 5,
+    'morkie_europa': 6,
+    'random': 7
+}
+
 class Menu:
     def __init__(self):
         self.wrap_manager = WrapManager()
@@ -43,32 +56,41 @@ class Menu:
 5. Mint an Unicorn NFT from morkie.xyz.
 6. Mint an Europa NFT from morkie.xyz.                
 7. Random interaction
-8. Quit\n''')
+8. Balance snapshot
+9. Quit\n''')
         
-        choice = int(input('Choose an option (1-8): '))
+        choice = int(input('Choose an option (1-9): '))
         return choice
 
-    def shuffle_wallets(self, private_keys: list, proxies: list = None) -> tuple[list, list, list]:
-        indices = list(range(len(private_keys)))
-        if SHUFFLE_WALLETS:
-            random.shuffle(indices)
-            private_keys = [private_keys[i] for i in indices]
-            if proxies:
-                proxies = [proxies[i % len(proxies)] for i in indices]
-        return private_keys, proxies, indices
-    
-    async def handle_choice(self, choice: int, private_keys_list: list, proxies_list: list) -> Optional[bool]:
-        private_keys, proxies, shuffled_indices = self.shuffle_wallets(private_keys_list, proxies_list)
-    
+    @staticmethod
+    async def take_snapshot(wallets: list[Wallet], networks: tuple) -> bool:
+        addresses = [wallet.address for wallet in wallets]
+        try:
+            for network in networks:
+                await balance_snapshot.take(network, addresses)
+            return True
+        except Exception as e:
+            logger.warning(f'Error taking balance snapshot: {e}.')
+            return False
+
+    async def with_snapshot(self, wallet_source: WalletSource, networks: tuple) -> AsyncIterator[Wallet]:
+        batch_size = SNAPSHOT_PARAMS['chunk_size']
+        async for wallets in wallet_source.blocks():
+            for i in range(0, len(wallets), batch_size):
+                batch = wallets[i:i + batch_size]
+                await self.take_snapshot(batch, networks)
+                for wallet in batch:
+                    yield wallet
+
+    def get_account_processor(self, choice: int) -> Callable[[Wallet], Awaitable]:
         if choice == 1:
-            async def process_account(private_key: str, i: int):
+            async def process_account(wallet: Wallet):
+                account_index = wallet.index
                 try:
-                    account_index = shuffled_indices[i]
-                    proxy = proxies[i % len(proxies)] if proxies else None
-                    client_eth = Client(private_key, ethereum_sepolia, proxy)
-                    client_uni = Client(private_key, unichain_sepolia, proxy)
+                    client_eth = Client.from_wallet(wallet, ethereum_sepolia)
+                    client_uni = Client.from_wallet(wallet, unichain_sepolia)
             
-                    result = await self.bridge_manager.bridge_eth(client_eth, client_uni, BRIDGE_PARAMS, account_index)
+                    result = await journal.run_step(client_eth.wallet_address, 'bridge', self.bridge_manager.bridge_eth(client_eth, client_uni, BRIDGE_PARAMS, account_index))
             
                     if isinstance(result, Exception) or result is False:
                         logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge failed with error: {result}.')
@@ -83,27 +105,13 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Error processing account: {e}.')
                     return False
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                task = asyncio.create_task(process_account(private_key, i))
-                account_tasks.append(task)
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
-
         elif choice == 2:
-            async def process_account(private_key: str, i: int):
+            async def process_account(wallet: Wallet):
+                account_index = wallet.index
                 try:
-                    account_index = shuffled_indices[i]
-                    proxy = proxies[i % len(proxies)] if proxies else None
-                    client_uni = Client(private_key, unichain_sepolia, proxy)
+                    client_uni = Client.from_wallet(wallet, unichain_sepolia)
             
-                    result = await self.wrap_manager.wrap_eth(client_uni, WRAP_PARAMS, account_index)
+                    result = await journal.run_step(client_uni.wallet_address, 'wrap', self.wrap_manager.wrap_eth(client_uni, WRAP_PARAMS, account_index))
             
                     if isinstance(result, Exception) or result is False:
                         logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Wrap failed with error: {result}.')
@@ -118,33 +126,19 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Error processing account: {e}.')
                     return False
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                task = asyncio.create_task(process_account(private_key, i))
-                account_tasks.append(task)
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
-
         elif choice == 3:
             second_choice = int(input('Enter an integer number of how many contracts you want to deploy: '))
 
-            async def process_account(private_key: str, i: int):
+            async def process_account(wallet: Wallet):
+                account_index = wallet.index
                 try:
-                    account_index = shuffled_indices[i]
-                    proxy = proxies[i % len(proxies)] if proxies else None
-                    client_uni = Client(private_key, unichain_sepolia, proxy)
+                    client_uni = Client.from_wallet(wallet, unichain_sepolia)
             
                     account_results = []
 
                     for contract_index in range(second_choice):
-                        name, symbol = await Utils.get_random_name_and_symbol(NAMES_PATH, SYMBOLS_PATH)
-                        contract_address = await self.erc721_manager.deploy_erc721(client_uni, name, symbol, account_index, is_first_tx=(contract_index==0))
+                        name, symbol = name_pool.sample(client_uni.wallet_address, contract_index)
+                        contract_address = await journal.run_step(client_uni.wallet_address, f'erc721_deploy:{contract_index}', self.erc721_manager.deploy_erc721(client_uni, name, symbol, account_index, is_first_tx=(contract_index==0)))
                        
                         if isinstance(contract_address, Exception) or contract_address is False:
                             logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-721 contract deployment {contract_index+1} failed with error: {contract_address}.')
@@ -155,7 +149,7 @@ class Menu:
                         
                         if contract_address:
                             account_results.append((contract_index, contract_address))
-                            mint_result = await self.erc721_manager.mint_nft(client_uni, contract_address, account_index)
+                            mint_result = await journal.run_step(client_uni.wallet_address, f'erc721_mint:{contract_index}', self.erc721_manager.mint_nft(client_uni, contract_address, account_index))
                     
                             if isinstance(mint_result, Exception) or mint_result is False:
                                 logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Mint NFT with contract {contract_index+1} failed with error: {mint_result}.')
@@ -170,34 +164,19 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Error processing account: {e}.')
                     return []
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                account_tasks.append(asyncio.create_task(
-                    process_account(private_key, i))
-                )
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
-
         elif choice == 4:
             second_choice = int(input('Enter an integer number of how many contracts you want to deploy: '))
 
-            async def process_account(private_key: str, i: int):
+            async def process_account(wallet: Wallet):
+                account_index = wallet.index
                 try:
-                    account_index = shuffled_indices[i]
-                    proxy = proxies[i % len(proxies)] if proxies else None
-                    client_uni = Client(private_key, unichain_sepolia, proxy)
+                    client_uni = Client.from_wallet(wallet, unichain_sepolia)
             
                     account_results = []
             
                     for contract_index in range(second_choice):
-                        name, symbol = await Utils.get_random_name_and_symbol(NAMES_PATH, SYMBOLS_PATH)
-                        contract_address = await self.erc20_manager.deploy_erc20(client_uni, name, symbol, account_index, is_first_tx=(contract_index==0))
+                        name, symbol = name_pool.sample(client_uni.wallet_address, contract_index)
+                        contract_address = await journal.run_step(client_uni.wallet_address, f'erc20_deploy:{contract_index}', self.erc20_manager.deploy_erc20(client_uni, name, symbol, account_index, is_first_tx=(contract_index==0)))
                 
                         if isinstance(contract_address, Exception) or contract_address is False:
                             logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-20 contract deployment {contract_index+1} failed with error: {contract_address}.')
@@ -208,7 +187,7 @@ class Menu:
                 
                         if contract_address:
                             account_results.append((contract_index, contract_address))
-                            interact_result = await self.erc20_manager.interact_with_contract(client_uni, contract_address, account_index)
+                            interact_result = await journal.run_step(client_uni.wallet_address, f'erc20_interact:{contract_index}', self.erc20_manager.interact_with_contract(client_uni, contract_address, account_index))
                     
                             if isinstance(interact_result, Exception) or interact_result is False:
                                 logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Interact with contract {contract_index+1} failed with error: {interact_result}.')
@@ -223,27 +202,13 @@ class Menu:
                     logger.error(f'Error processing account {account_index+1}: {e}.')
                     return []
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                task = asyncio.create_task(process_account(private_key, i))
-                account_tasks.append(task)
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
-
         elif choice == 5:
-            async def process_account(private_key: str, i: int):
+            async def process_account(wallet: Wallet):
+                account_index = wallet.index
                 try:
-                    account_index = shuffled_indices[i]
-                    proxy = proxies[i % len(proxies)] if proxies else None
-                    client_uni = Client(private_key, unichain_sepolia, proxy)
+                    client_uni = Client.from_wallet(wallet, unichain_sepolia)
             
-                    result = await self.morkie_manager.mint_unicorn_nft(client_uni, account_index)
+                    result = await journal.run_step(client_uni.wallet_address, 'morkie_unicorn', self.morkie_manager.mint_unicorn_nft(client_uni, account_index))
             
                     if isinstance(result, Exception) or result is False:
                         logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Minting Unicorn NFT failed with error: {result}.')
@@ -258,27 +223,13 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Error processing account: {e}.')
                     return False
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                task = asyncio.create_task(process_account(private_key, i))
-                account_tasks.append(task)
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
-
         elif choice == 6:
-            async def process_account(private_key: str, i: int):
+            async def process_account(wallet: Wallet):
+                account_index = wallet.index
                 try:
-                    account_index = shuffled_indices[i]
-                    proxy = proxies[i % len(proxies)] if proxies else None
-                    client_uni = Client(private_key, unichain_sepolia, proxy)
+                    client_uni = Client.from_wallet(wallet, unichain_sepolia)
             
-                    result = await self.morkie_manager.mint_europa_nft(client_uni, account_index)
+                    result = await journal.run_step(client_uni.wallet_address, 'morkie_europa', self.morkie_manager.mint_europa_nft(client_uni, account_index))
             
                     if isinstance(result, Exception) or result is False:
                         logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Minting Europa NFT failed with error: {result}.')
@@ -293,25 +244,11 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Error processing account: {e}.')
                     return False
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                task = asyncio.create_task(process_account(private_key, i))
-                account_tasks.append(task)
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
-
         elif choice == 7:
-            async def process_account(private_key: str, i: int):
+            async def process_account(wallet: Wallet):
+                account_index = wallet.index
                 try:
-                    account_index = shuffled_indices[i]
-                    proxy = proxies[i % len(proxies)] if proxies else None
-                    client_uni = Client(private_key, unichain_sepolia, proxy)
+                    client_uni = Client.from_wallet(wallet, unichain_sepolia)
             
                     result = await self.random_manager.random_interactions(client_uni, account_index)
             
@@ -328,20 +265,112 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Error processing account: {e}.')
                     return False
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                task = asyncio.create_task(process_account(private_key, i))
-                account_tasks.append(task)
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-            
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
+        return process_account
+
+    async def run_bridge_pipeline(self, scheduler: AccountScheduler, wallets: AsyncIterator[Wallet]) -> None:
+        follow_up = BRIDGE_PARAMS['follow_up']
+        process_follow_up = self.get_account_processor(FOLLOW_UP_CHOICES[follow_up]) if follow_up else None
+        follow_up_slots = asyncio.Semaphore(SCHEDULER_PARAMS['max_in_flight'])
+        arrivals = set()
+
+        async def finish_bridge(wallet: Wallet, client_eth: Client, client_uni: Client, tx_hash: Optional[str]):
+            account_index = wallet.index
+            try:
+                if tx_hash:
+                    amount = await self.bridge_manager.confirm_bridge(client_eth, client_uni, tx_hash, account_index)
+
+                    if amount is False:
+                        journal.record(client_eth.wallet_address, 'bridge', 'failed')
+                        logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge failed: transaction in {ethereum_sepolia.name} was not successful.')
+                        return
+                    if amount is None:
+                        journal.record(client_eth.wallet_address, 'bridge', 'pending')
+                        logger.warning(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge sent but the deposit did not arrive in {unichain_sepolia.name} in time, skipping follow-up.')
+                        return
+
+                    journal.record(client_eth.wallet_address, 'bridge', 'success')
+                    logger.success(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge completed successfully.')
+
+                if process_follow_up:
+                    async with follow_up_slots:
+                        await process_follow_up(wallet)
+            except Exception as e:
+                logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Error finishing bridge: {e}.')
+            finally:
+                nonce_managers.discard(unichain_sepolia, client_uni.wallet_address)
+                for network in (ethereum_sepolia, unichain_sepolia):
+                    await provider_pool.release(network, wallet.proxy)
+
+        async def process_account(wallet: Wallet):
+            account_index = wallet.index
+            for network in (ethereum_sepolia, unichain_sepolia):
+                provider_pool.acquire(network, wallet.proxy)
+            finishing = False
+            try:
+                client_eth = Client.from_wallet(wallet, ethereum_sepolia)
+                client_uni = Client.from_wallet(wallet, unichain_sepolia)
+
+                tx_hash = None
+                if journal.is_pending(client_eth.wallet_address, 'bridge'):
+                    logger.warning(f'{client_eth.wallet_address} | Skipping bridge: its transaction {journal.steps[(client_eth.wallet_address, "bridge")][2]} is still pending, run --resume again once it is mined or dropped.')
+                    return None
+                elif journal.is_done(client_eth.wallet_address, 'bridge'):
+                    logger.info(f'{client_eth.wallet_address} | Skipping bridge: already completed in run {journal.run_id}.')
+                else:
+                    bridge_amount = await self.bridge_manager.get_bridge_amount(client_eth, BRIDGE_PARAMS, account_index)
+                    if bridge_amount is not False:
+                        with journal.step(client_eth.wallet_address, 'bridge'):
+                            tx_hash = await self.bridge_manager.submit_bridge(client_eth, client_uni, bridge_amount, account_index)
+
+                    if not tx_hash:
+                        journal.record(client_eth.wallet_address, 'bridge', 'failed')
+                        logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge failed: deposit was not sent.')
+                        return False
+
+                task = asyncio.create_task(finish_bridge(wallet, client_eth, client_uni, tx_hash))
+                arrivals.add(task)
+                task.add_done_callback(arrivals.discard)
+                finishing = True
+                return True
+
+            except Exception as e:
+                logger.error(f'Account {account_index+1} | {wallet.address} | Error processing account: {e}.')
+                return False
+            finally:
+                if not finishing:
+                    for network in (ethereum_sepolia, unichain_sepolia):
+                        await provider_pool.release(network, wallet.proxy)
+
+        await scheduler.run(process_account, wallets, networks=(ethereum_sepolia,))
+
+        if arrivals:
+            logger.info(f'All deposits sent, waiting for {len(arrivals)} wallets to arrive in {unichain_sepolia.name}...')
+            await asyncio.gather(*arrivals, return_exceptions=True)
+
+    async def handle_choice(self, choice: int, wallet_source: WalletSource) -> Optional[bool]:
+        wallets = wallet_source
+        scheduler = AccountScheduler()
+
+        if SNAPSHOT_PARAMS['preflight'] and 1 <= choice <= 7:
+            wallets = self.with_snapshot(wallet_source, (ethereum_sepolia if choice == 1 else unichain_sepolia,))
+    
+        if choice == 1 and BRIDGE_PARAMS['pipeline']:
+            await self.run_bridge_pipeline(scheduler, wallets)
+
+        elif 1 <= choice <= 7:
+            networks = (ethereum_sepolia, unichain_sepolia) if choice == 1 else (unichain_sepolia,)
+            await scheduler.run(self.get_account_processor(choice), wallets, networks=networks)
+            if choice == 7:
+                logger.info(self.random_manager.workflow.stats())
 
         elif choice == 8:
+            saved = True
+            async for wallets in wallet_source.blocks():
+                saved = await self.take_snapshot(wallets, (ethereum_sepolia, unichain_sepolia)) and saved
+            if saved:
+                balance_snapshot.save()
+
+        elif choice == 9:
             logger.info('Exiting...')
             return None
         
@@ -0,0 +1,180 @@
+import asyncio
+from typing import Optional, Union
+
+import aiohttp
+from aiohttp import web
+from loguru import logger
+
+from config import METRICS_PARAMS
+
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+RATE_LIMIT_ERRORS = ('rate limit', 'rate-limit', 'ratelimit', 'too many requests', 'request limit')
+
+RATE_LIMIT_CODES = (-32005, -32029, 429)
+
+
+class MethodStats:
+    __slots__ = ('calls', 'latency_sum', 'buckets', 'errors')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.latency_sum = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.errors: dict[str, int] = {}
+
+    def observe(self, latency: float, error_class: Optional[str]) -> None:
+        self.calls += 1
+        self.latency_sum += latency
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+        if error_class:
+            self.errors[error_class] = self.errors.get(error_class, 0) + 1
+
+    def percentile(self, q: float) -> float:
+        target = self.calls * q
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and count:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else float('inf')
+        return 0.0
+
+
+class RpcMetrics:
+    def __init__(self, metrics_params: dict = METRICS_PARAMS) -> None:
+        self.metrics_params = metrics_params
+        self.stats: dict[tuple[str, str, str], MethodStats] = {}
+        self.summary_task: Optional[asyncio.Task] = None
+        self.runner: Optional[web.AppRunner] = None
+
+    @staticmethod
+    def get_proxy_label(proxy: Optional[str]) -> str:
+        return proxy.rsplit('@', 1)[-1] if proxy else 'direct'
+
+    @staticmethod
+    def classify_error(error: Union[Exception, dict, str]) -> str:
+        if isinstance(error, aiohttp.ClientResponseError):
+            if error.status == 429:
+                return 'rate_limited'
+            return 'http_5xx' if error.status >= 500 else f'http_{error.status}'
+        if isinstance(error, asyncio.TimeoutError):
+            return 'timeout'
+        if isinstance(error, aiohttp.ClientConnectionError):
+            return 'connection'
+        if isinstance(error, Exception):
+            return type(error).__name__
+
+        code = error.get('code') if isinstance(error, dict) else None
+        message = str(error.get('message', '') if isinstance(error, dict) else error).lower()
+        if code in RATE_LIMIT_CODES or any(text in message for text in RATE_LIMIT_ERRORS):
+            return 'rate_limited'
+        if 'revert' in message:
+            return 'reverted'
+        if 'nonce' in message:
+            return 'nonce'
+        return f'rpc_{code}' if code is not None else 'rpc_error'
+
+    def observe(self, network: str, proxy: Optional[str], method: str, latency: float, error_class: Optional[str] = None) -> None:
+        if not self.metrics_params['enabled']:
+            return
+        key = (network, self.get_proxy_label(proxy), method)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = MethodStats()
+            self.stats[key] = stats
+        stats.observe(latency, error_class)
+
+    def get_methods(self) -> dict[str, MethodStats]:
+        methods: dict[str, MethodStats] = {}
+        for (_, _, method), stats in self.stats.items():
+            total = methods.setdefault(method, MethodStats())
+            total.calls += stats.calls
+            total.latency_sum += stats.latency_sum
+            total.buckets = [a + b for a, b in zip(total.buckets, stats.buckets)]
+            for error_class, count in stats.errors.items():
+                total.errors[error_class] = total.errors.get(error_class, 0) + count
+        return methods
+
+    def summary(self, top: int = 6) -> str:
+        methods = self.get_methods()
+        calls = sum(stats.calls for stats in methods.values())
+        errors = sum(sum(stats.errors.values()) for stats in methods.values())
+        if not calls:
+            return 'RPC summary | no calls'
+
+        parts = []
+        for method, stats in sorted(methods.items(), key=lambda item: item[1].calls, reverse=True)[:top]:
+            part = f'{method} {stats.calls} ({stats.calls / calls:.0%}, avg {stats.latency_sum / stats.calls * 1000:.0f}ms, p99 <= {stats.percentile(0.99) * 1000:.0f}ms'
+            if stats.errors:
+                part += ', errors ' + ' '.join(f'{error_class}={count}' for error_class, count in stats.errors.items())
+            parts.append(part + ')')
+        return f'RPC summary | {calls} calls, {errors} errors | ' + ', '.join(parts)
+
+    def render_prometheus(self) -> str:
+        lines = [
+            '# HELP rpc_requests_total JSON-RPC calls sent.',
+            '# TYPE rpc_requests_total counter'
+        ]
+        for (network, proxy, method), stats in self.stats.items():
+            lines.append(f'rpc_requests_total{{network="{network}",proxy="{proxy}",method="{method}"}} {stats.calls}')
+
+        lines += ['# HELP rpc_errors_total JSON-RPC calls that failed, by error class.', '# TYPE rpc_errors_total counter']
+        for (network, proxy, method), stats in self.stats.items():
+            for error_class, count in stats.errors.items():
+                lines.append(f'rpc_errors_total{{network="{network}",proxy="{proxy}",method="{method}",error_class="{error_class}"}} {count}')
+
+        lines += ['# HELP rpc_request_duration_seconds JSON-RPC call latency.', '# TYPE rpc_request_duration_seconds histogram']
+        for (network, proxy, method), stats in self.stats.items():
+            labels = f'network="{network}",proxy="{proxy}",method="{method}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += count
+                lines.append(f'rpc_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'rpc_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.calls}')
+            lines.append(f'rpc_request_duration_seconds_sum{{{labels}}} {stats.latency_sum:.6f}')
+            lines.append(f'rpc_request_duration_seconds_count{{{labels}}} {stats.calls}')
+        return '\n'.join(lines) + '\n'
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=self.render_prometheus(), content_type='text/plain')
+
+    async def log_summary(self) -> None:
+        while True:
+            await asyncio.sleep(self.metrics_params['summary_interval'])
+            logger.info(self.summary())
+
+    async def start(self) -> None:
+        if not self.metrics_params['enabled']:
+            return
+
+        if self.metrics_params['summary_interval']:
+            self.summary_task = asyncio.create_task(self.log_summary())
+
+        port = self.metrics_params['prometheus_port']
+        if port:
+            app = web.Application()
+            app.router.add_get('/metrics', self.handle_metrics)
+            self.runner = web.AppRunner(app, access_log=None)
+            await self.runner.setup()
+            await web.TCPSite(self.runner, '127.0.0.1', port).start()
+            logger.info(f'Prometheus metrics available at http://127.0.0.1:{port}/metrics')
+
+    async def close(self) -> None:
+        if self.summary_task:
+            self.summary_task.cancel()
+            self.summary_task = None
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+        if self.stats:
+            logger.info(self.summary())
+
+
+rpc_metrics = RpcMetrics()
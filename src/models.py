@@ -22,9 +22,10 @@ class TokenAmount:
 
 
 class Network:
-    def __init__(self, name: str, rpc: str, chain_id: int, coin_symbol: str, explorer: str, decimals: int = 18):
+    def __init__(self, name: str, rpc: Union[str, list[str]], chain_id: int, coin_symbol: str, explorer: str, decimals: int = 18):
         self.name = name
-        self.rpc = rpc
+        self.rpcs = [rpc] if isinstance(rpc, str) else list(rpc)
+        self.rpc = self.rpcs[0]
         self.chain_id = chain_id
         self.coin_symbol = coin_symbol
         self.decimals = decimals
@@ -3,11 +3,17 @@ from typing import Optional
 from loguru import logger
 
 from src.client import Client
+from src.manager import Manager
+
+
+UNICORN_NFT_ADDRESS = '0x99F4146B950Ec5B8C6Bc1Aa6f6C9b14b6ADc6256'
+
+EUROPA_NFT_ADDRESS = '0x2188DA4AE1CAaFCf2fBFb3ef34227F3FFdc46AB6'
 
 
 class MorkieManager():
     async def mint_unicorn_nft(self, client_uni: Client, account_index: int) -> Optional[bool]:
-        balance = await client_uni.w3.eth.get_balance(client_uni.wallet_address)
+        balance = await Manager.get_balance(client_uni)
         
         if balance <= 0:
             logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Mint cancelled: zero balance.')
@@ -17,7 +23,7 @@ class MorkieManager():
             logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Attempting to mint an Unicorn NFT from morkie.xyz...')
             
             result = await client_uni.mint_morkie_nft(
-                contract_address='0x99F4146B950Ec5B8C6Bc1Aa6f6C9b14b6ADc6256',
+                contract_address=UNICORN_NFT_ADDRESS,
                 account_index=account_index,
             )
 
@@ -27,7 +33,7 @@ class MorkieManager():
             return False
 
     async def mint_europa_nft(self, client_uni: Client, account_index: int) -> Optional[bool]:
-        balance = await client_uni.w3.eth.get_balance(client_uni.wallet_address)
+        balance = await Manager.get_balance(client_uni)
         
         if balance <= 0:
             logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Mint cancelled: zero balance.')
@@ -37,7 +43,7 @@ class MorkieManager():
             logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Attempting to mint an Europa NFT from morkie.xyz...')
             
             result = await client_uni.mint_morkie_nft(
-                contract_address='0x2188DA4AE1CAaFCf2fBFb3ef34227F3FFdc46AB6',
+                contract_address=EUROPA_NFT_ADDRESS,
                 account_index=account_index,
             )
             
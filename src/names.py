@@ -0,0 +1,47 @@
+import math
+import random
+from typing import Optional
+
+from loguru import logger
+
+from src.utils import Utils
+from src.vars import NAMES_PATH, SYMBOLS_PATH
+from config import NAME_POOL_PARAMS
+
+
+class NamePool:
+    def __init__(self, pool_params: dict = NAME_POOL_PARAMS) -> None:
+        self.pool_params = pool_params
+        self.seed = pool_params['seed'] if pool_params['seed'] is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)
+        self.pairs: tuple[tuple[str, str], ...] = ()
+
+    def set_seed(self, seed) -> None:
+        if seed != self.seed:
+            logger.info(f'Using token name seed {seed} from run journal.')
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    async def preload(self, names_path: str = NAMES_PATH, symbols_path: str = SYMBOLS_PATH) -> None:
+        names = (await Utils.read_file(names_path)).splitlines()
+        symbols = (await Utils.read_file(symbols_path)).splitlines()
+        self.pairs = tuple((name.strip(), symbol.strip()) for name, symbol in zip(names, symbols) if name.strip() and symbol.strip())
+        logger.info(f'Preloaded {len(self.pairs)} token names and symbols.')
+
+    def sample(self, wallet_address: Optional[str] = None, draw_index: int = 0) -> tuple[str, str]:
+        if not self.pairs:
+            raise RuntimeError('Name pool is empty: call preload() first.')
+
+        if not self.pool_params['no_repeat'] or wallet_address is None:
+            return self.pairs[self.rng.randrange(len(self.pairs))]
+
+        size = len(self.pairs)
+        wallet_rng = random.Random(f'{self.seed}:{wallet_address}')
+        start = wallet_rng.randrange(size)
+        step = wallet_rng.randrange(1, size) if size > 1 else 1
+        while math.gcd(step, size) != 1:
+            step = wallet_rng.randrange(1, size)
+        return self.pairs[(start + draw_index * step) % size]
+
+
+name_pool = NamePool()
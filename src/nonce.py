@@ -0,0 +1,65 @@
+import asyncio
+from typing import Optional
+
+from web3 import AsyncWeb3
+
+from src.models import Network
+
+
+NONCE_ERRORS = ('nonce too low', 'replacement transaction underpriced', 'nonce too high', 'invalid nonce')
+
+
+class NonceManager:
+    def __init__(self, w3: AsyncWeb3, wallet_address: str) -> None:
+        self.w3 = w3
+        self.wallet_address = wallet_address
+        self.lock = asyncio.Lock()
+        self.next_nonce: Optional[int] = None
+
+    async def fetch_pending_nonce(self) -> int:
+        return await self.w3.eth.get_transaction_count(self.wallet_address, 'pending')
+
+    async def allocate(self) -> int:
+        async with self.lock:
+            if self.next_nonce is None:
+                self.next_nonce = await self.fetch_pending_nonce()
+            nonce = self.next_nonce
+            self.next_nonce += 1
+            return nonce
+
+    async def resync(self) -> int:
+        async with self.lock:
+            self.next_nonce = await self.fetch_pending_nonce()
+            return self.next_nonce
+
+    def release(self, nonce: int) -> None:
+        if self.next_nonce is None:
+            return
+        if nonce == self.next_nonce - 1:
+            self.next_nonce = nonce
+        else:
+            self.next_nonce = None
+
+    @staticmethod
+    def is_nonce_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return any(text in message for text in NONCE_ERRORS)
+
+
+class NonceRegistry:
+    def __init__(self) -> None:
+        self.managers: dict[tuple[str, str], NonceManager] = {}
+
+    def get(self, w3: AsyncWeb3, network: Network, wallet_address: str) -> NonceManager:
+        key = (network.name, wallet_address)
+        manager = self.managers.get(key)
+        if manager is None:
+            manager = NonceManager(w3, wallet_address)
+            self.managers[key] = manager
+        return manager
+
+    def discard(self, network: Network, wallet_address: str) -> None:
+        self.managers.pop((network.name, wallet_address), None)
+
+
+nonce_managers = NonceRegistry()
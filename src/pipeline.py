@@ -0,0 +1,131 @@
+import os
+import time
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Union
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import AsyncWeb3
+from eth_account import Account
+
+from config import PIPELINE_PARAMS
+
+
+def sign_transaction(tx_params: dict, private_key: Union[str, bytes]) -> tuple[bytes, bytes]:
+    signed = Account.sign_transaction(tx_params, private_key)
+    return bytes(signed.rawTransaction), bytes(signed.hash)
+
+
+class StageMetrics:
+    def __init__(self) -> None:
+        self.processed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.wait_time = 0.0
+        self.max_queue_size = 0
+
+    def observe(self, queue_size: int, waited: float, busy: float, failed: bool = False) -> None:
+        self.processed += 1
+        self.failed += failed
+        self.wait_time += waited
+        self.busy_time += busy
+        self.max_queue_size = max(self.max_queue_size, queue_size)
+
+    def stats(self) -> dict:
+        return {
+            'processed': self.processed,
+            'failed': self.failed,
+            'avg_wait_ms': round(self.wait_time / self.processed * 1000, 2) if self.processed else 0.0,
+            'avg_busy_ms': round(self.busy_time / self.processed * 1000, 2) if self.processed else 0.0,
+            'max_queue_size': self.max_queue_size
+        }
+
+
+class TxPipeline:
+    def __init__(self, pipeline_params: dict = PIPELINE_PARAMS) -> None:
+        self.pipeline_params = pipeline_params
+        self.sign_queue: Optional[asyncio.Queue] = None
+        self.broadcast_queue: Optional[asyncio.Queue] = None
+        self.executor: Optional[Executor] = None
+        self.workers: list[asyncio.Task] = []
+        self.sign_metrics = StageMetrics()
+        self.broadcast_metrics = StageMetrics()
+
+    def start(self) -> None:
+        sign_workers = self.pipeline_params['sign_workers'] or os.cpu_count() or 1
+        if self.pipeline_params['executor'] == 'process':
+            self.executor = ProcessPoolExecutor(max_workers=sign_workers)
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=sign_workers)
+
+        self.sign_queue = asyncio.Queue(maxsize=self.pipeline_params['queue_size'])
+        self.broadcast_queue = asyncio.Queue(maxsize=self.pipeline_params['queue_size'])
+        self.workers = [asyncio.create_task(self.sign_worker()) for _ in range(sign_workers)]
+        self.workers += [asyncio.create_task(self.broadcast_worker()) for _ in range(self.pipeline_params['broadcasters'])]
+
+    async def submit(self, w3: AsyncWeb3, tx_params: dict, private_key: Union[str, bytes]) -> HexBytes:
+        if not self.workers:
+            self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self.sign_queue.put((w3, dict(tx_params), private_key, future, time.monotonic()))
+        return await future
+
+    async def sign_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            w3, tx_params, private_key, future, queued_at = await self.sign_queue.get()
+            started_at = time.monotonic()
+            try:
+                raw_transaction, tx_hash = await loop.run_in_executor(self.executor, sign_transaction, tx_params, private_key)
+            except Exception as e:
+                self.sign_metrics.observe(self.sign_queue.qsize(), started_at - queued_at, time.monotonic() - started_at, failed=True)
+                if not future.done():
+                    future.set_exception(e)
+                continue
+
+            self.sign_metrics.observe(self.sign_queue.qsize(), started_at - queued_at, time.monotonic() - started_at)
+            await self.broadcast_queue.put((w3, raw_transaction, tx_hash, future, time.monotonic()))
+
+    async def broadcast_worker(self) -> None:
+        while True:
+            w3, raw_transaction, tx_hash, future, queued_at = await self.broadcast_queue.get()
+            started_at = time.monotonic()
+            failed = False
+            try:
+                result = await w3.eth.send_raw_transaction(raw_transaction)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if 'already known' in str(e):
+                    if not future.done():
+                        future.set_result(HexBytes(tx_hash))
+                else:
+                    failed = True
+                    if not future.done():
+                        future.set_exception(e)
+
+            self.broadcast_metrics.observe(self.broadcast_queue.qsize(), started_at - queued_at, time.monotonic() - started_at, failed=failed)
+
+    def stats(self) -> dict:
+        return {
+            'sign': self.sign_metrics.stats(),
+            'broadcast': self.broadcast_metrics.stats()
+        }
+
+    async def close(self) -> None:
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+        if self.sign_metrics.processed:
+            logger.info(f'Transaction pipeline stats: {self.stats()}')
+
+
+tx_pipeline = TxPipeline()
@@ -0,0 +1,283 @@
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+import aiohttp
+from web3 import AsyncWeb3
+from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
+from loguru import logger
+
+from src.models import Network
+from src.batching import RequestBatcher
+from src.limiter import rpc_limiters
+from src.router import Endpoint, RpcRouter, FAILOVER_ERRORS, rpc_routers
+from src.metrics import rpc_metrics
+from config import RPC_POOL_PARAMS, RPC_BATCH_PARAMS, ROUTER_PARAMS, LIMITER_PARAMS
+
+
+BATCHABLE_METHODS = ('eth_getBalance', 'eth_getTransactionCount', 'eth_call')
+
+BROADCAST_METHODS = ('eth_sendRawTransaction',)
+
+
+class ChainIdMismatchError(Exception):
+    pass
+
+
+class PooledHTTPProvider(AsyncWeb3.AsyncHTTPProvider):
+    def __init__(self, endpoint_uri: str, proxy: Optional[str] = None, pool_params: dict = RPC_POOL_PARAMS, network_name: str = '', router: Optional[RpcRouter] = None) -> None:
+        super().__init__(endpoint_uri=endpoint_uri)
+        self.network_name = network_name or endpoint_uri
+        self.router = router
+        self.proxy_label = proxy
+        self.proxy = f'http://{proxy}' if proxy else None
+        self.pool_params = pool_params
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.batcher = RequestBatcher(self) if RPC_BATCH_PARAMS['enabled'] else None
+        self.http_requests = 0
+        self.rpc_calls = 0
+
+    def get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.pool_params['limit_per_host'],
+                keepalive_timeout=self.pool_params['keepalive_timeout']
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.get_request_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.pool_params['request_timeout'])
+            )
+        return self.session
+
+    async def post(self, request_data: bytes, endpoint_uri: Optional[str] = None) -> bytes:
+        self.http_requests += 1
+        async with self.get_session().post(endpoint_uri or self.endpoint_uri, data=request_data, proxy=self.proxy) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    def get_endpoints(self) -> list[Optional[Endpoint]]:
+        return self.router.get_endpoints() if self.router else [None]
+
+    def observe(self, endpoint: Optional[Endpoint], methods: Iterable[str], latency: float, error_class: Optional[str] = None) -> None:
+        for method in methods:
+            rpc_metrics.observe(self.network_name, self.proxy_label, method, latency, error_class)
+        if endpoint:
+            self.router.observe(endpoint, latency, error_class)
+
+    async def make_request(self, method, params):
+        if self.batcher and method in BATCHABLE_METHODS:
+            return await self.batcher.request(method, params)
+        return await self.send_request(method, params)
+
+    async def send_to_endpoint(self, endpoint: Optional[Endpoint], methods: dict[Any, str], request_data: bytes) -> tuple[Any, Optional[str]]:
+        uri = endpoint.uri if endpoint else self.endpoint_uri
+        limiter = rpc_limiters.get(uri, self.proxy_label) if LIMITER_PARAMS['enabled'] else None
+        if limiter:
+            await limiter.acquire()
+
+        self.rpc_calls += len(methods)
+        started_at = time.monotonic()
+        error_class = 'cancelled'
+        try:
+            try:
+                response = FriendlyJsonSerde().json_decode(await self.post(request_data, uri))
+            except Exception as e:
+                error_class = rpc_metrics.classify_error(e)
+                self.observe(endpoint, methods.values(), time.monotonic() - started_at, error_class)
+                raise
+
+            latency = time.monotonic() - started_at
+            error_class = None
+            if isinstance(response, dict):
+                error = response.get('error')
+                error_class = rpc_metrics.classify_error(error) if error else None
+                self.observe(endpoint, methods.values(), latency, error_class)
+            else:
+                error_classes = set()
+                for entry in response:
+                    error = entry.get('error')
+                    entry_error_class = rpc_metrics.classify_error(error) if error else None
+                    error_classes.add(entry_error_class)
+                    rpc_metrics.observe(self.network_name, self.proxy_label, methods.get(entry.get('id'), 'unknown'), latency, entry_error_class)
+                error_class = next((failover_error for failover_error in FAILOVER_ERRORS if failover_error in error_classes), None)
+                if endpoint:
+                    self.router.observe(endpoint, latency, error_class)
+
+            return response, error_class
+        finally:
+            if limiter:
+                await asyncio.shield(limiter.release(error_class))
+
+    async def route(self, methods: dict[Any, str], request_data: bytes) -> Any:
+        attempts = 0
+        while True:
+            for endpoint in self.get_endpoints():
+                try:
+                    response, error_class = await self.send_to_endpoint(endpoint, methods, request_data)
+                except Exception as e:
+                    response, error_class = e, rpc_metrics.classify_error(e)
+                if error_class not in FAILOVER_ERRORS or isinstance(response, list):
+                    break
+
+            attempts += 1
+            if error_class != 'rate_limited' or isinstance(response, list) or attempts > LIMITER_PARAMS['max_retries']:
+                break
+
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def send_request(self, method, params):
+        request_data = self.encode_rpc_request(method, params)
+        endpoints = self.get_endpoints()
+        if method in BROADCAST_METHODS and len(endpoints) > 1 and ROUTER_PARAMS['broadcast_fanout'] > 1:
+            return await self.broadcast(endpoints[:ROUTER_PARAMS['broadcast_fanout']], method, request_data)
+        return await self.route({None: method}, request_data)
+
+    async def broadcast(self, endpoints: list[Endpoint], method: str, request_data: bytes) -> dict:
+        results = await asyncio.gather(*(self.send_to_endpoint(endpoint, {None: method}, request_data) for endpoint in endpoints), return_exceptions=True)
+        responses = [result[0] for result in results if not isinstance(result, Exception)]
+        if not responses:
+            raise results[0]
+
+        for response in responses:
+            if 'result' in response:
+                return response
+        return responses[0]
+
+    @staticmethod
+    def should_retry(response: dict) -> bool:
+        error = response.get('error')
+        return bool(error) and rpc_metrics.classify_error(error) in FAILOVER_ERRORS
+
+    async def make_batch_request(self, requests: list[tuple[str, Any]]) -> list[dict]:
+        methods = {}
+        payload = {}
+        for method, params in requests:
+            request_id = next(self.request_counter)
+            methods[request_id] = method
+            payload[request_id] = {'jsonrpc': '2.0', 'method': method, 'params': params or [], 'id': request_id}
+
+        responses_by_id = {}
+        pending = methods
+        for _ in range(LIMITER_PARAMS['max_retries'] + 1):
+            request_data = FriendlyJsonSerde().json_encode([payload[request_id] for request_id in pending], cls=Web3JsonEncoder).encode()
+            responses = await self.route(pending, request_data)
+            if isinstance(responses, dict):
+                responses_by_id.update((request_id, responses) for request_id in pending)
+                break
+
+            responses_by_id.update((response.get('id'), response) for response in responses)
+            pending = {
+                request_id: method for request_id, method in pending.items()
+                if request_id in responses_by_id and self.should_retry(responses_by_id[request_id])
+            }
+            if not pending:
+                break
+
+        return [
+            responses_by_id.get(request_id, {'error': {'code': -32603, 'message': 'Missing response in batch'}})
+            for request_id in methods
+        ]
+
+    async def disconnect(self) -> None:
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+
+class ProviderPool:
+    def __init__(self, pool_params: dict = RPC_POOL_PARAMS) -> None:
+        self.pool_params = pool_params
+        self.web3s: dict[tuple[str, Optional[str]], AsyncWeb3] = {}
+        self.references: dict[tuple[str, Optional[str]], int] = {}
+        self.idle: OrderedDict[tuple[str, Optional[str]], float] = OrderedDict()
+        self.verified_rpcs: set[str] = set()
+        self.released = 0
+
+    def get_web3(self, network: Network, proxy: Optional[str] = None) -> AsyncWeb3:
+        key = (network.name, proxy)
+        w3 = self.web3s.get(key)
+        if w3 is None:
+            w3 = AsyncWeb3(PooledHTTPProvider(endpoint_uri=network.rpc, proxy=proxy, network_name=network.name, router=rpc_routers.get(network)))
+            w3.middleware_onion.remove('validation')
+            self.web3s[key] = w3
+        return w3
+
+    def acquire(self, network: Network, proxy: Optional[str] = None) -> AsyncWeb3:
+        key = (network.name, proxy)
+        self.references[key] = self.references.get(key, 0) + 1
+        self.idle.pop(key, None)
+        return self.get_web3(network, proxy)
+
+    async def release(self, network: Network, proxy: Optional[str] = None) -> None:
+        key = (network.name, proxy)
+        references = self.references.get(key, 0) - 1
+        if references > 0:
+            self.references[key] = references
+            return
+
+        self.references.pop(key, None)
+        if proxy is not None and key in self.web3s:
+            self.idle[key] = time.monotonic()
+            self.idle.move_to_end(key)
+        await self.evict_idle()
+
+    async def evict_idle(self) -> None:
+        expires_before = time.monotonic() - self.pool_params['idle_timeout']
+        while self.idle:
+            key, released_at = next(iter(self.idle.items()))
+            if len(self.idle) <= self.pool_params['idle_providers'] and released_at > expires_before:
+                break
+
+            self.idle.popitem(last=False)
+            w3 = self.web3s.pop(key, None)
+            if w3 is not None:
+                self.released += 1
+                await w3.provider.disconnect()
+
+    async def verify_chain_id(self, network: Network) -> None:
+        provider = self.get_web3(network).provider
+        router = rpc_routers.get(network)
+        reachable = 0
+        last_error = None
+
+        for endpoint in router.endpoints:
+            if endpoint.uri in self.verified_rpcs:
+                reachable += 1
+                continue
+
+            try:
+                response, _ = await provider.send_to_endpoint(endpoint, {None: 'eth_chainId'}, provider.encode_rpc_request('eth_chainId', []))
+                rpc_chain_id = int(response['result'], 16)
+            except Exception as e:
+                last_error = e
+                logger.warning(f'{network.name} | Could not verify chain id for {endpoint.uri}: {e}')
+                continue
+
+            if rpc_chain_id != network.chain_id:
+                raise ChainIdMismatchError(f'{network.name} RPC {endpoint.uri} reports chain id {rpc_chain_id}, expected {network.chain_id}.')
+
+            reachable += 1
+            self.verified_rpcs.add(endpoint.uri)
+            logger.info(f'{network.name} | Verified chain id {network.chain_id} for {endpoint.uri}.')
+
+        if not reachable:
+            raise last_error
+
+    async def close(self) -> None:
+        for w3 in self.web3s.values():
+            await w3.provider.disconnect()
+        for limiter in rpc_limiters.limiters.values():
+            if limiter.rate_limited:
+                logger.info(f'RPC limiter | {limiter.stats()}')
+        for router in rpc_routers.routers.values():
+            if len(router.endpoints) > 1:
+                logger.info(f'{router.network.name} | RPC endpoints: {router.stats()}')
+        logger.info(f'Closed {len(self.web3s)} pooled RPC providers' + (f', {self.released} idle proxied providers released before.' if self.released else '.'))
+        self.web3s.clear()
+        self.idle.clear()
+
+
+provider_pool = ProviderPool()
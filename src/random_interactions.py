@@ -1,16 +1,15 @@
-import random
-from typing import Optional
+from typing import Coroutine, Optional
 
 from loguru import logger
 
-from src.utils import Utils
 from src.client import Client
+from src.names import name_pool
 from src.wrap import WrapManager
+from src.workflow import Workflow
 from src.erc_20 import ERC20Manager
 from src.morkie import MorkieManager
 from src.erc_721 import ERC721Manager
-from config import RANDOM_CONFIG, WRAP_PARAMS
-from src.vars import NAMES_PATH, SYMBOLS_PATH
+from config import WRAP_PARAMS
 
 
 class RandomManager:
@@ -19,77 +18,29 @@ class RandomManager:
         self.erc20_manager = ERC20Manager()
         self.erc721_manager = ERC721Manager()
         self.morkie_manager = MorkieManager()
+        self.workflow = Workflow()
+
+    def get_action(self, action: str, client_uni: Client, account_index: int, draw_index: int, contract_address: Optional[str] = None) -> Coroutine:
+        if action == 'erc721_deploy':
+            name, symbol = name_pool.sample(client_uni.wallet_address, draw_index)
+            return self.erc721_manager.deploy_erc721(client_uni, name, symbol, account_index, is_first_tx=(draw_index == 0))
+        elif action == 'erc721_mint':
+            return self.erc721_manager.mint_nft(client_uni, contract_address, account_index)
+        elif action == 'erc20_deploy':
+            name, symbol = name_pool.sample(client_uni.wallet_address, draw_index)
+            return self.erc20_manager.deploy_erc20(client_uni, name, symbol, account_index, is_first_tx=(draw_index == 0))
+        elif action == 'erc20_interact':
+            return self.erc20_manager.interact_with_contract(client_uni, contract_address, account_index)
+        elif action == 'wrap':
+            return self.wrap_manager.wrap_eth(client_uni, WRAP_PARAMS, account_index)
+        elif action == 'morkie_unicorn':
+            return self.morkie_manager.mint_unicorn_nft(client_uni, account_index)
+        else:
+            return self.morkie_manager.mint_europa_nft(client_uni, account_index)
 
     async def random_interactions(self, client_uni: Client, account_index: int) -> Optional[bool]:
         try:
-            erc721_count = random.randint(RANDOM_CONFIG['max_actions']['erc721_count'][0], RANDOM_CONFIG['max_actions']['erc721_count'][1])
-            erc20_count = random.randint(RANDOM_CONFIG['max_actions']['erc20_count'][0], RANDOM_CONFIG['max_actions']['erc20_count'][1])
-            wrap_count = random.randint(RANDOM_CONFIG['max_actions']['wrap_count'][0], RANDOM_CONFIG['max_actions']['wrap_count'][1])
-        
-            for i in range(erc721_count):
-                name, symbol = await Utils.get_random_name_and_symbol(NAMES_PATH, SYMBOLS_PATH)
-                logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Deploying ERC-721 contract {i+1}/{erc721_count}...')
-            
-                contract_address = await self.erc721_manager.deploy_erc721(client_uni, name, symbol, account_index, is_first_tx=(i==0 and erc721_count > 0))
-            
-                if isinstance(contract_address, Exception) or contract_address is None:
-                    logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-721 Deploy {i+1} failed with error: {contract_address}.')
-                elif contract_address:
-                    logger.success(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-721 Deploy {i+1} completed successfully.')
-
-                    logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Starting mint for ERC-721 contract {i+1}.')
-                    mint_result = await self.erc721_manager.mint_nft(client_uni, contract_address, account_index)
-                
-                    if isinstance(mint_result, Exception) or mint_result is False:
-                        logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-721 Mint {i+1} failed with error: {mint_result}.')
-                    else:
-                        logger.success(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-721 Mint {i+1} completed successfully.')
-        
-            for i in range(erc20_count):
-                name, symbol = await Utils.get_random_name_and_symbol(NAMES_PATH, SYMBOLS_PATH)
-                logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Deploying ERC-20 contract {i+1}/{erc20_count}...')
-            
-                contract_address = await self.erc20_manager.deploy_erc20(client_uni, name, symbol, account_index, is_first_tx=(i==0 and erc721_count == 0))
-            
-                if isinstance(contract_address, Exception) or contract_address is None:
-                    logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-20 Deploy {i+1} failed with error: {contract_address}.')
-                elif contract_address:
-                    logger.success(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-20 Deploy {i+1} completed successfully.')
-
-                    logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Starting interaction with ERC-20 contract {i+1}...')
-                    interact_result = await self.erc20_manager.interact_with_contract(client_uni, contract_address, account_index)
-                
-                    if isinstance(interact_result, Exception) or interact_result is False:
-                        logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-20 Interaction {i+1} failed with error: {interact_result}.')
-                    else:
-                        logger.success(f'Account {account_index+1} | {client_uni.wallet_address} | ERC-20 Interaction {i+1} completed successfully.')
-
-            for i in range(wrap_count):
-                logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Wrap {i+1}/{wrap_count}...')
-            
-                result = await self.wrap_manager.wrap_eth(client_uni, WRAP_PARAMS, account_index)
-            
-                if isinstance(result, Exception) or result is False:
-                    logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Wrap {i+1} failed with error: {result}.')
-                else:
-                    logger.success(f'Account {account_index+1} | {client_uni.wallet_address} | Wrap {i+1} completed successfully.')
-
-            if RANDOM_CONFIG['mint_morkie_nfts'] == True:
-                logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Starting Morkie NFT mints...')
-
-                unicorn_result = await self.morkie_manager.mint_unicorn_nft(client_uni, account_index)
-                if isinstance(unicorn_result, Exception) or unicorn_result is False:
-                    logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Unicorn NFT mint failed.')
-                else:
-                    logger.success(f'Account {account_index+1} | {client_uni.wallet_address} | Unicorn NFT mint completed successfully.')
-
-                europa_result = await self.morkie_manager.mint_europa_nft(client_uni, account_index)
-                if isinstance(europa_result, Exception) or europa_result is False:
-                    logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Europa NFT mint failed.')
-                else:
-                    logger.success(f'Account {account_index+1} | {client_uni.wallet_address} | Europa NFT mint completed successfully.')
-
-            return True
+            return await self.workflow.run(client_uni, account_index, self.get_action)
 
         except Exception as e:
             logger.error(f'Account {account_index+1} | Error during random interactions: {e}.')
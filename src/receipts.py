@@ -0,0 +1,124 @@
+import asyncio
+from typing import Union
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3.datastructures import AttributeDict
+from web3._utils.method_formatters import receipt_formatter
+
+from src.models import Network
+from src.providers import provider_pool
+from src.blocks import BlockTracker, block_trackers
+from config import BLOCK_TRACKER_PARAMS
+
+
+METHOD_NOT_FOUND = -32601
+
+UNSUPPORTED_ERRORS = ('method not found', 'does not exist', 'not supported', 'unsupported')
+
+
+class ReceiptTracker:
+    def __init__(self, network: Network, block_tracker: BlockTracker, tracker_params: dict = BLOCK_TRACKER_PARAMS) -> None:
+        self.network = network
+        self.block_tracker = block_tracker
+        self.tracker_params = tracker_params
+        self.pending: dict[str, asyncio.Future] = {}
+        self.registered_at: dict[str, int] = {}
+        self.block_receipts_supported = True
+        self.block_tracker.subscribe(self.on_block)
+
+    @staticmethod
+    def normalize_hash(tx_hash: Union[str, bytes]) -> str:
+        return '0x' + bytes(HexBytes(tx_hash)).hex()
+
+    async def wait_for_receipt(self, tx_hash: Union[str, bytes], timeout: float) -> AttributeDict:
+        key = self.normalize_hash(tx_hash)
+        future = self.pending.get(key)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.pending[key] = future
+            self.registered_at[key] = self.block_tracker.block_number or 0
+            self.block_tracker.hold()
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            if self.pending.get(key) is future:
+                self.forget(key)
+
+    def forget(self, key: str) -> None:
+        if self.pending.pop(key, None) is not None:
+            self.registered_at.pop(key, None)
+            self.block_tracker.release()
+
+    def resolve(self, raw_receipt: dict) -> None:
+        key = self.normalize_hash(raw_receipt['transactionHash'])
+        future = self.pending.get(key)
+        if future is not None and not future.done():
+            future.set_result(AttributeDict.recursive(receipt_formatter(raw_receipt)))
+
+    async def on_block(self, block_number: int) -> None:
+        if not self.pending:
+            return
+
+        fetched = self.block_receipts_supported and await self.fetch_block_receipts(block_number)
+
+        sweep_blocks = self.tracker_params['sweep_blocks']
+        stale_hashes = [
+            key for key, registered_at in self.registered_at.items()
+            if not self.pending[key].done()
+            and (not fetched or (block_number - registered_at) % sweep_blocks == sweep_blocks - 1)
+        ]
+        if stale_hashes:
+            await self.fetch_receipts(stale_hashes)
+
+    @staticmethod
+    def is_unsupported(error) -> bool:
+        if isinstance(error, dict) and error.get('code') == METHOD_NOT_FOUND:
+            return True
+        message = str(error).lower()
+        return any(text in message for text in UNSUPPORTED_ERRORS)
+
+    async def fetch_block_receipts(self, block_number: int) -> bool:
+        provider = provider_pool.get_web3(self.network).provider
+        try:
+            response = await provider.make_request('eth_getBlockReceipts', [hex(block_number)])
+        except Exception as e:
+            logger.debug(f'{self.network.name} | eth_getBlockReceipts failed for block {block_number}, fetching receipts one by one: {e}')
+            return False
+
+        if 'error' in response:
+            if self.is_unsupported(response['error']):
+                logger.info(f'{self.network.name} | eth_getBlockReceipts is not supported, falling back to batched receipt requests: {response["error"]}')
+                self.block_receipts_supported = False
+            else:
+                logger.debug(f'{self.network.name} | eth_getBlockReceipts failed for block {block_number}, fetching receipts one by one: {response["error"]}')
+            return False
+
+        for raw_receipt in response.get('result') or []:
+            self.resolve(raw_receipt)
+        return True
+
+    async def fetch_receipts(self, tx_hashes: list[str]) -> None:
+        provider = provider_pool.get_web3(self.network).provider
+        responses = await provider.make_batch_request([('eth_getTransactionReceipt', [tx_hash]) for tx_hash in tx_hashes])
+
+        for response in responses:
+            if response.get('result'):
+                self.resolve(response['result'])
+
+
+class ReceiptTrackerRegistry:
+    def __init__(self) -> None:
+        self.trackers: dict[str, ReceiptTracker] = {}
+
+    def get(self, network: Network) -> ReceiptTracker:
+        tracker = self.trackers.get(network.name)
+        if tracker is None:
+            tracker = ReceiptTracker(network, block_trackers.get(network))
+            self.trackers[network.name] = tracker
+        return tracker
+
+
+receipt_trackers = ReceiptTrackerRegistry()
@@ -0,0 +1,84 @@
+import time
+import random
+from typing import Optional
+
+from loguru import logger
+
+from src.models import Network
+from config import ROUTER_PARAMS
+
+
+FAILOVER_ERRORS = ('rate_limited', 'http_5xx', 'timeout', 'connection')
+
+
+class Endpoint:
+    __slots__ = ('uri', 'latency', 'error_rate', 'failures', 'cooldown_until', 'calls', 'errors')
+
+    def __init__(self, uri: str) -> None:
+        self.uri = uri
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.cooldown_until = 0.0
+        self.calls = 0
+        self.errors = 0
+
+    def score(self) -> float:
+        return (self.latency or 0.0) / max(1 - self.error_rate, 0.05)
+
+
+class RpcRouter:
+    def __init__(self, network: Network, router_params: dict = ROUTER_PARAMS) -> None:
+        self.network = network
+        self.router_params = router_params
+        self.endpoints = [Endpoint(uri) for uri in network.rpcs]
+        self.rng = random.Random()
+
+    def get_endpoints(self) -> list[Endpoint]:
+        now = time.monotonic()
+        available = sorted((endpoint for endpoint in self.endpoints if endpoint.cooldown_until <= now), key=Endpoint.score)
+        if not available:
+            return sorted(self.endpoints, key=lambda endpoint: endpoint.cooldown_until)
+
+        if len(available) > 1 and self.rng.random() < self.router_params['explore_ratio']:
+            available.insert(0, available.pop(self.rng.randrange(1, len(available))))
+        return available
+
+    def observe(self, endpoint: Endpoint, latency: float, error_class: Optional[str] = None) -> None:
+        endpoint.calls += 1
+        failed = error_class in FAILOVER_ERRORS
+        endpoint.error_rate += self.router_params['error_alpha'] * (failed - endpoint.error_rate)
+
+        if not failed:
+            endpoint.failures = 0
+            alpha = self.router_params['latency_alpha']
+            endpoint.latency = latency if endpoint.latency is None else endpoint.latency + alpha * (latency - endpoint.latency)
+            return
+
+        endpoint.errors += 1
+        endpoint.failures += 1
+        cooldown = min(self.router_params['cooldown'] * 2 ** (endpoint.failures - 1), self.router_params['max_cooldown'])
+        endpoint.cooldown_until = time.monotonic() + cooldown
+        if len(self.endpoints) > 1:
+            logger.warning(f'{self.network.name} | RPC {endpoint.uri} out of rotation for {cooldown}s: {error_class}')
+
+    def stats(self) -> str:
+        return ', '.join(
+            f'{endpoint.uri} {endpoint.calls} calls ({endpoint.errors} errors, latency {(endpoint.latency or 0) * 1000:.0f}ms)'
+            for endpoint in self.endpoints
+        )
+
+
+class RouterRegistry:
+    def __init__(self) -> None:
+        self.routers: dict[str, RpcRouter] = {}
+
+    def get(self, network: Network) -> RpcRouter:
+        router = self.routers.get(network.name)
+        if router is None:
+            router = RpcRouter(network)
+            self.routers[network.name] = router
+        return router
+
+
+rpc_routers = RouterRegistry()
@@ -0,0 +1,118 @@
+import time
+import signal
+import asyncio
+import contextlib
+from typing import AsyncIterable, Awaitable, Callable, Iterable
+
+from loguru import logger
+
+from src.models import Network
+from src.nonce import nonce_managers
+from src.wallets import Wallet
+from src.providers import provider_pool
+from config import SCHEDULER_PARAMS
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AccountScheduler:
+    def __init__(self, scheduler_params: dict = SCHEDULER_PARAMS) -> None:
+        self.scheduler_params = scheduler_params
+        self.in_flight = asyncio.Semaphore(scheduler_params['max_in_flight'])
+        self.bucket = TokenBucket(scheduler_params['start_rate'], scheduler_params['burst'])
+        self.proxy_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.draining = False
+        self.started = 0
+        self.finished = 0
+        self.failed = 0
+
+    def get_proxy_semaphore(self, proxy: str) -> asyncio.Semaphore:
+        if proxy not in self.proxy_semaphores:
+            self.proxy_semaphores[proxy] = asyncio.Semaphore(self.scheduler_params['per_proxy'])
+        return self.proxy_semaphores[proxy]
+
+    def drain(self) -> None:
+        if not self.draining:
+            self.draining = True
+            logger.warning(f'Draining: no new accounts will be started, waiting for {self.started - self.finished} in-flight accounts...')
+
+    async def run_account(self, process_account: Callable[..., Awaitable], wallet: Wallet, networks: Iterable[Network]) -> None:
+        result = None
+        proxy = wallet.proxy
+        for network in networks:
+            provider_pool.acquire(network, proxy)
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                if proxy:
+                    await stack.enter_async_context(self.get_proxy_semaphore(proxy))
+
+                result = await process_account(wallet)
+        finally:
+            if not result or isinstance(result, Exception):
+                self.failed += 1
+
+            address = wallet.address
+            for network in networks:
+                nonce_managers.discard(network, address)
+                await provider_pool.release(network, proxy)
+
+            self.finished += 1
+            self.in_flight.release()
+
+    async def run(self, process_account: Callable[..., Awaitable], wallets: AsyncIterable[Wallet], networks: Iterable[Network] = ()) -> None:
+        networks = tuple(networks)
+        tasks = set()
+        self.install_drain_handler()
+
+        try:
+            async for wallet in wallets:
+                await self.in_flight.acquire()
+                if self.draining:
+                    self.in_flight.release()
+                    break
+
+                await self.bucket.acquire()
+                self.started += 1
+
+                task = asyncio.create_task(self.run_account(process_account, wallet, networks))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.remove_drain_handler()
+
+        logger.info(f'Scheduler finished: {self.finished} accounts processed, {self.failed} failed.')
+
+    def install_drain_handler(self) -> None:
+        with contextlib.suppress(NotImplementedError, RuntimeError):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGINT, self.on_interrupt)
+
+    def remove_drain_handler(self) -> None:
+        with contextlib.suppress(NotImplementedError, RuntimeError):
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGINT)
+
+    def on_interrupt(self) -> None:
+        self.drain()
+        self.remove_drain_handler()
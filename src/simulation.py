@@ -0,0 +1,168 @@
+import os
+import time
+from typing import Optional, Union
+
+import rlp
+import ujson
+from web3 import Web3
+from hexbytes import HexBytes
+from eth_utils import keccak, to_checksum_address
+from web3.datastructures import AttributeDict
+from loguru import logger
+
+from src.journal import current_step
+from src.vars import RESULTS_DIR
+from config import SIMULATION_PARAMS
+
+
+UNVERIFIABLE_GAS_LIMIT = 200000
+
+class Simulator:
+    def __init__(self, simulation_params: dict = SIMULATION_PARAMS) -> None:
+        self.simulation_params = simulation_params
+        self.enabled = False
+        self.codes: dict[tuple[str, str], dict[str, HexBytes]] = {}
+        self.receipts: dict[HexBytes, AttributeDict] = {}
+        self.entries: list[dict] = []
+
+    def enable(self) -> None:
+        self.enabled = True
+        logger.warning('Simulation mode: transactions are run with eth_call and never broadcast.')
+
+    @property
+    def balance_override(self) -> Optional[int]:
+        balance = self.simulation_params['balance_override']
+        return int(balance * 10 ** 18) if self.enabled and balance is not None else None
+
+    @staticmethod
+    def get_create_address(sender: str, nonce: int) -> str:
+        return to_checksum_address(keccak(rlp.encode([bytes.fromhex(sender[2:]), nonce]))[12:])
+
+    def is_simulated_deploy(self, client, address: Optional[str]) -> bool:
+        return address is not None and address in self.codes.get((client.network.name, client.wallet_address), {})
+
+    def get_state_override(self, client) -> Optional[dict]:
+        codes = self.codes.get((client.network.name, client.wallet_address), {})
+        state_override = {address: {'code': code} for address, code in codes.items()}
+        if self.balance_override is not None:
+            state_override.setdefault(client.wallet_address, {})['balance'] = self.balance_override
+        return state_override or None
+
+    def record(self, client, tx_params: dict, status: str, error: Optional[Exception] = None) -> dict:
+        step = current_step.get()
+        entry = {
+            'wallet': client.wallet_address,
+            'action': step[1] if step else None,
+            'network': client.network.name,
+            'to': tx_params.get('to'),
+            'status': status,
+            'gas': tx_params.get('gas') if status == 'success' else None,
+            'max_fee_per_gas': tx_params.get('maxFeePerGas', tx_params.get('gasPrice')),
+            'error': str(error) if error else None
+        }
+        self.entries.append(entry)
+        return entry
+
+    @staticmethod
+    def mark(error: Exception, status: str) -> None:
+        entry = getattr(error, 'simulation_entry', None)
+        if entry is not None:
+            entry['status'] = status
+
+    async def estimate_gas(self, client, tx_params: dict) -> int:
+        state_override = self.get_state_override(client)
+        try:
+            if state_override is None:
+                return await client.w3.eth.estimate_gas(tx_params)
+            return await client.w3.eth.estimate_gas(tx_params, state_override=state_override)
+        except Exception as e:
+            if self.is_simulated_deploy(client, tx_params.get('to')):
+                return UNVERIFIABLE_GAS_LIMIT
+            e.simulation_entry = self.record(client, tx_params, 'revert', e)
+            raise
+
+    async def simulate(self, client, tx_params: dict) -> HexBytes:
+        nonce = tx_params.get('nonce')
+        if nonce is None:
+            nonce = await client.nonce_manager.allocate()
+        call_params = {key: value for key, value in tx_params.items() if key not in ('nonce', 'chainId')}
+        contract_address = None if tx_params.get('to') else self.get_create_address(client.wallet_address, nonce)
+
+        state_override = self.get_state_override(client)
+        try:
+            if state_override is None:
+                result = await client.w3.eth.call(call_params)
+            else:
+                result = await client.w3.eth.call(call_params, state_override=state_override)
+            status = 1
+            self.record(client, tx_params, 'success')
+        except Exception as e:
+            result = None
+            if self.is_simulated_deploy(client, tx_params.get('to')):
+                status = 1
+                self.record(client, tx_params, 'unverifiable', e)
+            else:
+                status = 0
+                self.record(client, tx_params, 'revert', e)
+
+        if contract_address and status:
+            self.codes.setdefault((client.network.name, client.wallet_address), {})[contract_address] = HexBytes(result)
+
+        tx_hash = HexBytes(Web3.keccak(text=f'{client.network.name}:{client.wallet_address}:{nonce}'))
+        self.receipts[tx_hash] = AttributeDict({
+            'transactionHash': tx_hash,
+            'status': status,
+            'contractAddress': contract_address,
+            'gasUsed': tx_params.get('gas', 0),
+            'value': tx_params.get('value', 0)
+        })
+        return tx_hash
+
+    def get_receipt(self, tx_hash: Union[str, bytes]) -> Optional[AttributeDict]:
+        receipt = self.receipts.get(HexBytes(tx_hash))
+        return receipt if receipt and receipt.status == 1 else None
+
+    def summary(self) -> dict:
+        succeeded = [entry for entry in self.entries if entry['status'] == 'success']
+        total_gas = sum(entry['gas'] or 0 for entry in succeeded)
+        max_cost = sum((entry['gas'] or 0) * (entry['max_fee_per_gas'] or 0) for entry in succeeded)
+
+        unverifiable = [entry for entry in self.entries if entry['status'] == 'unverifiable']
+        failed = [entry for entry in self.entries if entry['status'] not in ('success', 'unverifiable')]
+
+        failures: dict[str, int] = {}
+        for entry in failed:
+            action = (entry['action'] or 'unknown').split(':')[0]
+            key = f'{action} {entry["status"]}'
+            failures[key] = failures.get(key, 0) + 1
+
+        return {
+            'transactions': len(self.entries),
+            'succeeded': len(succeeded),
+            'failed': len(failed),
+            'unverifiable': len(unverifiable),
+            'wallets_with_failures': len({entry['wallet'] for entry in failed}),
+            'total_gas': total_gas,
+            'max_cost_eth': max_cost / 10 ** 18,
+            'failures': failures
+        }
+
+    def save(self, name: str = None) -> str:
+        name = name or f'simulation_{time.strftime("%Y%m%d_%H%M%S")}'
+        path = os.path.join(RESULTS_DIR, f'{name}.json')
+        summary = self.summary()
+
+        with open(path, 'w') as f:
+            ujson.dump({'summary': summary, 'transactions': self.entries}, f, indent=4)
+
+        failures = ', '.join(f'{key} x{count}' for key, count in summary['failures'].items())
+        logger.info(
+            f'Simulation | {summary["transactions"]} transactions: {summary["succeeded"]} would succeed, {summary["failed"]} would fail'
+            f' on {summary["wallets_with_failures"]} wallets, {summary["unverifiable"]} could not be checked. Estimated gas {summary["total_gas"]}, max cost {summary["max_cost_eth"]:.6f} ETH.'
+            + (f' Failures: {failures}.' if failures else '')
+        )
+        logger.success(f'Simulation report saved to {path}.')
+        return path
+
+
+simulator = Simulator()
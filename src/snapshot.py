@@ -0,0 +1,104 @@
+import os
+import csv
+import time
+import asyncio
+from typing import Optional
+
+import ujson
+from loguru import logger
+
+from src.models import Network
+from src.artifacts import artifacts
+from src.providers import provider_pool
+from src.vars import MULTICALL3_ABI, WETH_ABI, RESULTS_DIR
+from config import SNAPSHOT_PARAMS
+
+
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+
+WETH_ADDRESSES = {
+    'Sepolia': '0xfFf9976782d46CC05630D1f6eBAb18b2324d6B14',
+    'Unichain Sepolia': '0x4200000000000000000000000000000000000006'
+}
+
+
+class BalanceSnapshot:
+    def __init__(self, snapshot_params: dict = SNAPSHOT_PARAMS) -> None:
+        self.snapshot_params = snapshot_params
+        self.balances: dict[str, dict[str, dict[str, Optional[int]]]] = {}
+        self.taken_at: dict[str, dict[str, float]] = {}
+
+    async def take(self, network: Network, addresses: list[str]) -> dict[str, dict[str, Optional[int]]]:
+        w3 = provider_pool.get_web3(network)
+        multicall = await artifacts.get_contract(w3, MULTICALL3_ABI, address=MULTICALL3_ADDRESS)
+        weth_address = WETH_ADDRESSES.get(network.name)
+        weth = await artifacts.get_contract(w3, WETH_ABI, address=weth_address) if weth_address else None
+
+        chunk_size = self.snapshot_params['chunk_size']
+        semaphore = asyncio.Semaphore(self.snapshot_params['concurrency'])
+        network_balances = self.balances.setdefault(network.name, {})
+        network_taken_at = self.taken_at.setdefault(network.name, {})
+
+        async def read_chunk(chunk: list[str]) -> None:
+            calls = []
+            for address in chunk:
+                calls.append((multicall.address, True, multicall.encode_abi('getEthBalance', args=[address])))
+                if weth:
+                    calls.append((weth.address, True, weth.encode_abi('balanceOf', args=[address])))
+
+            async with semaphore:
+                results = await multicall.functions.aggregate3(calls).call()
+
+            step = 2 if weth else 1
+            taken_at = time.monotonic()
+            for i, address in enumerate(chunk):
+                network_taken_at[address] = taken_at
+                network_balances[address] = {
+                    'eth': self.decode_uint(results[i * step]),
+                    'weth': self.decode_uint(results[i * step + 1]) if weth else None
+                }
+
+        started_at = time.monotonic()
+        await asyncio.gather(*[
+            read_chunk(addresses[i:i + chunk_size]) for i in range(0, len(addresses), chunk_size)
+        ])
+        logger.info(f'{network.name} | Snapshot of {len(addresses)} wallets taken in {time.monotonic() - started_at:.2f} seconds.')
+
+        return network_balances
+
+    @staticmethod
+    def decode_uint(result: tuple) -> Optional[int]:
+        success, return_data = result
+        if not success or len(return_data) < 32:
+            return None
+        return int.from_bytes(return_data[:32], 'big')
+
+    def pop_balance(self, network: Network, address: str) -> Optional[int]:
+        balances = self.balances.get(network.name, {}).pop(address, None)
+        taken_at = self.taken_at.get(network.name, {}).pop(address, None)
+        if not balances or taken_at is None:
+            return None
+        if time.monotonic() - taken_at > self.snapshot_params['max_age']:
+            return None
+        return balances['eth']
+
+    def save(self, name: str = None) -> tuple[str, str]:
+        name = name or f'balances_{time.strftime("%Y%m%d_%H%M%S")}'
+        json_path = os.path.join(RESULTS_DIR, f'{name}.json')
+        csv_path = os.path.join(RESULTS_DIR, f'{name}.csv')
+
+        with open(json_path, 'w') as f:
+            ujson.dump(self.balances, f, indent=4)
+
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['network', 'address', 'eth_wei', 'weth_wei'])
+            for network_name, network_balances in self.balances.items():
+                for address, balances in network_balances.items():
+                    writer.writerow([network_name, address, balances['eth'], balances['weth']])
+
+        logger.success(f'Balance snapshot saved to {json_path} and {csv_path}.')
+        return json_path, csv_path
+
+
+balance_snapshot = BalanceSnapshot()
@@ -31,17 +31,6 @@ class Utils:
                     strings.append(line)
         return strings
 
-    @staticmethod
-    async def get_random_name_and_symbol(file1_path: str, file2_path: str) -> tuple:
-        async with aiofiles.open(file1_path, 'r') as f1, aiofiles.open(file2_path, 'r') as f2:
-            names = await f1.readlines()
-            symbols = await f2.readlines()
-        
-        paired_list = list(zip(names, symbols))
-        name, symbol = random.choice(paired_list)
-    
-        return name.strip(), symbol.strip()
-
     @staticmethod
     async def execute_with_delay(transaction, wallet_address: str, account_index: int):
         delay = random.randint(DELAY_BETWEEN_TX[0], DELAY_BETWEEN_TX[1])
@@ -12,9 +12,11 @@ ABIS_DIR = os.path.join(ROOT_DIR, 'abis')
 FILES_DIR = os.path.join(ROOT_DIR, 'files')
 LOGS_DIR = os.path.join(ROOT_DIR, 'logs')
 DATA_DIR = os.path.join(ROOT_DIR, 'data')
+RESULTS_DIR = os.path.join(ROOT_DIR, 'results')
 
 ETHBRIDGE_ABI = os.path.join(ABIS_DIR, 'ethbridge.json')
 WETH_ABI = os.path.join(ABIS_DIR, 'weth.json')
+MULTICALL3_ABI = os.path.join(ABIS_DIR, 'multicall3.json')
 
 ERC721_ABI = os.path.join(ABIS_DIR, 'erc721contract.json')
 ERC721_BYTECODE = os.path.join(DATA_DIR, 'erc721bytecode.txt')
@@ -29,3 +31,6 @@ PRIVATE_KEYS_PATH = os.path.join(FILES_DIR, 'private_keys.txt')
 PROXIES_PATH = os.path.join(FILES_DIR, 'proxies.txt')
 
 LOGS_PATH = os.path.join(LOGS_DIR, 'logs.txt')
+
+JOURNAL_PATH = os.path.join(RESULTS_DIR, 'journal.sqlite3')
+ADDRESS_CACHE_PATH = os.path.join(RESULTS_DIR, 'address_cache.sqlite3')
@@ -0,0 +1,208 @@
+import os
+import time
+import random
+import asyncio
+import hashlib
+import sqlite3
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Optional
+
+import aiofiles
+from hexbytes import HexBytes
+from loguru import logger
+from eth_account import Account
+from eth_utils import to_checksum_address
+
+from src.vars import ADDRESS_CACHE_PATH
+from config import WALLET_PARAMS, SHUFFLE_WALLETS
+
+
+CACHE_QUERY_CHUNK_SIZE = 500
+
+
+def derive_addresses(private_keys: list[str]) -> list[Optional[str]]:
+    addresses = []
+    for private_key in private_keys:
+        try:
+            addresses.append(Account.from_key(private_key).address)
+        except Exception:
+            addresses.append(None)
+    return addresses
+
+
+class Wallet:
+    __slots__ = ('index', 'key', 'address_bytes', 'proxy_index')
+
+    proxies: list[str] = []
+
+    def __init__(self, index: int, key: bytes, address_bytes: bytes, proxy_index: Optional[int] = None) -> None:
+        self.index = index
+        self.key = key
+        self.address_bytes = address_bytes
+        self.proxy_index = proxy_index
+
+    @property
+    def proxy(self) -> Optional[str]:
+        return self.proxies[self.proxy_index] if self.proxy_index is not None else None
+
+    @property
+    def private_key(self) -> str:
+        return '0x' + self.key.hex()
+
+    @property
+    def address(self) -> str:
+        return to_checksum_address(self.address_bytes)
+
+
+class WalletLoader:
+    def __init__(self, cache_path: str = ADDRESS_CACHE_PATH, wallet_params: dict = WALLET_PARAMS) -> None:
+        self.cache_path = cache_path
+        self.wallet_params = wallet_params
+        self.connection: Optional[sqlite3.Connection] = None
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.cached = 0
+        self.derived = 0
+
+    @staticmethod
+    def hash_key(private_key: str) -> str:
+        return hashlib.sha256(private_key.lower().removeprefix('0x').encode()).hexdigest()
+
+    def open_cache(self) -> None:
+        if self.connection is None and self.wallet_params['cache']:
+            self.connection = sqlite3.connect(self.cache_path)
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS addresses (key_hash TEXT PRIMARY KEY, address TEXT NOT NULL)')
+
+    def read_cache(self, key_hashes: list[str]) -> dict[str, str]:
+        if self.connection is None:
+            return {}
+
+        addresses = {}
+        for i in range(0, len(key_hashes), CACHE_QUERY_CHUNK_SIZE):
+            chunk = key_hashes[i:i + CACHE_QUERY_CHUNK_SIZE]
+            addresses.update(self.connection.execute(
+                f'SELECT key_hash, address FROM addresses WHERE key_hash IN ({",".join("?" * len(chunk))})', chunk
+            ))
+        return addresses
+
+    def write_cache(self, addresses: dict[str, str]) -> None:
+        if self.connection is not None and addresses:
+            self.connection.executemany('INSERT OR REPLACE INTO addresses (key_hash, address) VALUES (?, ?)', addresses.items())
+            self.connection.commit()
+
+    async def derive(self, private_keys: list[str]) -> list[Optional[str]]:
+        chunk_size = self.wallet_params['chunk_size']
+        if len(private_keys) <= chunk_size:
+            return derive_addresses(private_keys)
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.wallet_params['derive_workers'] or os.cpu_count() or 1)
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self.executor, derive_addresses, private_keys[i:i + chunk_size])
+            for i in range(0, len(private_keys), chunk_size)
+        ])
+        return [address for chunk_addresses in results for address in chunk_addresses]
+
+    async def prepare(self, keys: list[tuple[int, str]], proxies: list[str] = None) -> list[Wallet]:
+        self.open_cache()
+
+        key_hashes = [self.hash_key(private_key) for _, private_key in keys]
+        addresses = self.read_cache(key_hashes)
+        missing = [i for i, key_hash in enumerate(key_hashes) if key_hash not in addresses]
+        self.cached += len(keys) - len(missing)
+        self.derived += len(missing)
+
+        if missing:
+            derived = {}
+            for i, address in zip(missing, await self.derive([keys[i][1] for i in missing])):
+                if address:
+                    derived[key_hashes[i]] = address
+            self.write_cache(derived)
+            addresses.update(derived)
+
+        wallets = []
+        for (index, private_key), key_hash in zip(keys, key_hashes):
+            address = addresses.get(key_hash)
+            if address is None:
+                logger.error(f'Account {index+1} | Invalid private key, skipping wallet.')
+                continue
+            wallets.append(Wallet(index, bytes(HexBytes(private_key)), bytes.fromhex(address[2:]), index % len(proxies) if proxies else None))
+        return wallets
+
+    def close(self) -> None:
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+
+class WalletSource:
+    def __init__(self, keys_path: str, proxies: list[str] = None, loader: WalletLoader = None, wallet_params: dict = WALLET_PARAMS, shuffle: bool = SHUFFLE_WALLETS) -> None:
+        self.keys_path = keys_path
+        self.proxies = proxies
+        Wallet.proxies = proxies or []
+        self.loader = loader or WalletLoader(wallet_params=wallet_params)
+        self.wallet_params = wallet_params
+        self.shuffle = shuffle
+
+    async def read_keys(self) -> AsyncIterator[list[tuple[int, str]]]:
+        block_size = self.wallet_params['block_size']
+        block = []
+        index = 0
+        async with aiofiles.open(self.keys_path, 'r') as f:
+            async for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                block.append((index, line))
+                index += 1
+                if len(block) >= block_size:
+                    yield block
+                    block = []
+        if block:
+            yield block
+
+    async def blocks(self) -> AsyncIterator[list[Wallet]]:
+        rng = random.Random(self.wallet_params['shuffle_seed'])
+        started_at = time.monotonic()
+        total = 0
+        key_blocks = self.read_keys()
+        next_block: Optional[asyncio.Task] = None
+
+        async def prepare_next() -> Optional[list[Wallet]]:
+            keys = await anext(key_blocks, None)
+            return await self.loader.prepare(keys, self.proxies) if keys else None
+
+        try:
+            next_block = asyncio.create_task(prepare_next())
+            while True:
+                wallets = await next_block
+                if wallets is None:
+                    break
+                next_block = asyncio.create_task(prepare_next())
+
+                if self.shuffle:
+                    rng.shuffle(wallets)
+                total += len(wallets)
+                yield wallets
+        finally:
+            if next_block and not next_block.done():
+                next_block.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await next_block
+            await key_blocks.aclose()
+
+        logger.info(f'Loaded {total} wallets in {time.monotonic() - started_at:.2f} seconds ({self.loader.cached} addresses from cache, {self.loader.derived} derived).')
+
+    async def __aiter__(self) -> AsyncIterator[Wallet]:
+        async for wallets in self.blocks():
+            for wallet in wallets:
+                yield wallet
+
+    def close(self) -> None:
+        self.loader.close()
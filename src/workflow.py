@@ -0,0 +1,142 @@
+import time
+import random
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from loguru import logger
+
+from src.client import Client
+from src.journal import journal
+from config import WORKFLOW
+
+
+ACTIONS = ('erc721_deploy', 'erc721_mint', 'erc20_deploy', 'erc20_interact', 'wrap', 'morkie_unicorn', 'morkie_europa')
+
+PRODUCERS = ('erc721_deploy', 'erc20_deploy')
+
+CONSUMERS = {
+    'erc721_mint': 'erc721_deploy',
+    'erc20_interact': 'erc20_deploy'
+}
+
+
+class WorkflowNode:
+    __slots__ = ('name', 'action', 'count', 'weight', 'needs')
+
+    def __init__(self, name: str, action: str, count: Union[int, tuple] = 1, weight: float = 1, needs: tuple = ()) -> None:
+        self.name = name
+        self.action = action
+        self.count = count
+        self.weight = weight
+        self.needs = needs
+
+    @property
+    def source(self) -> Optional[str]:
+        return self.needs[0] if self.action in CONSUMERS else None
+
+    def sample_count(self, rng: random.Random) -> int:
+        if rng.random() >= self.weight:
+            return 0
+        if isinstance(self.count, tuple):
+            return rng.randint(self.count[0], self.count[1])
+        return self.count
+
+
+class Workflow:
+    def __init__(self, workflow: dict = WORKFLOW) -> None:
+        self.nodes = {
+            name: WorkflowNode(name, params.get('action', name), params.get('count', 1), params.get('weight', 1), tuple(params.get('needs', ())))
+            for name, params in workflow.items()
+        }
+        self.order = self.validate()
+        self.rng = random.Random()
+        self.timings: dict[str, list[float]] = {name: [] for name in self.order}
+
+    def validate(self) -> list[str]:
+        for node in self.nodes.values():
+            if node.action not in ACTIONS:
+                raise ValueError(f'Workflow node {node.name}: unknown action {node.action}, expected one of {", ".join(ACTIONS)}.')
+            for need in node.needs:
+                if need not in self.nodes:
+                    raise ValueError(f'Workflow node {node.name}: needs unknown node {need}.')
+            if node.action in CONSUMERS and (not node.needs or self.nodes[node.needs[0]].action != CONSUMERS[node.action]):
+                raise ValueError(f'Workflow node {node.name}: {node.action} must list a {CONSUMERS[node.action]} node first in needs.')
+
+        order = []
+        visiting = set()
+
+        def visit(name: str) -> None:
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f'Workflow has a dependency cycle through node {name}.')
+            visiting.add(name)
+            for need in self.nodes[name].needs:
+                visit(need)
+            visiting.discard(name)
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name)
+        return order
+
+    def plan(self) -> dict[str, int]:
+        counts = {}
+        for name in self.order:
+            node = self.nodes[name]
+            counts[name] = counts[node.source] if node.source else node.sample_count(self.rng)
+        return counts
+
+    async def run(self, client: Client, account_index: int, get_action: Callable[..., Awaitable]) -> bool:
+        counts = self.plan()
+        tasks: dict[str, list[asyncio.Task]] = {}
+        draw_index = 0
+        started_at = time.monotonic()
+
+        for name in self.order:
+            node = self.nodes[name]
+            waits = [task for need in node.needs if need != node.source for task in tasks[need]]
+            tasks[name] = []
+            for i in range(counts[name]):
+                source = tasks[node.source][i] if node.source else None
+                tasks[name].append(asyncio.create_task(self.run_node(client, account_index, node, i, draw_index + i, waits, source, get_action)))
+            if node.action in PRODUCERS:
+                draw_index += counts[name]
+
+        results = await asyncio.gather(*(task for node_tasks in tasks.values() for task in node_tasks), return_exceptions=True)
+        failed = sum(1 for result in results if isinstance(result, Exception) or result is False)
+        logger.info(f'Account {account_index+1} | {client.wallet_address} | Workflow finished in {time.monotonic() - started_at:.1f} seconds: {len(results)} steps, {failed} failed.')
+        return True
+
+    async def run_node(self, client: Client, account_index: int, node: WorkflowNode, i: int, draw_index: int, waits: list[asyncio.Task], source: Optional[asyncio.Task], get_action: Callable[..., Awaitable]) -> Any:
+        if waits:
+            await asyncio.gather(*waits, return_exceptions=True)
+
+        contract_address = None
+        if source:
+            try:
+                contract_address = await source
+            except Exception:
+                contract_address = None
+            if not contract_address:
+                return None
+
+        started_at = time.monotonic()
+        result = await journal.run_step(client.wallet_address, f'random_{node.name}:{i}', get_action(node.action, client, account_index, draw_index, contract_address))
+        elapsed = time.monotonic() - started_at
+        self.timings[node.name].append(elapsed)
+
+        if isinstance(result, Exception) or result is False:
+            logger.error(f'Account {account_index+1} | {client.wallet_address} | {node.name} {i+1} failed with error: {result} ({elapsed:.1f}s).')
+        elif result is None:
+            logger.warning(f'Account {account_index+1} | {client.wallet_address} | {node.name} {i+1} completed with no result ({elapsed:.1f}s).')
+        else:
+            logger.success(f'Account {account_index+1} | {client.wallet_address} | {node.name} {i+1} completed successfully ({elapsed:.1f}s).')
+        return result
+
+    def stats(self) -> str:
+        parts = [
+            f'{name} {len(timings)} runs (avg {sum(timings) / len(timings):.1f}s, max {max(timings):.1f}s)'
+            for name, timings in self.timings.items() if timings
+        ]
+        return 'Workflow node timings | ' + (', '.join(parts) if parts else 'no steps run')
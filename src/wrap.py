@@ -8,9 +8,12 @@ from src.manager import Manager
 from src.vars import WETH_ABI
 
 
+WETH_ADDRESS = '0x4200000000000000000000000000000000000006'
+
+
 class WrapManager:  
     async def wrap_eth(self, client_uni: Client, wrap_params: dict, account_index: int) -> bool:
-        balance = await client_uni.w3.eth.get_balance(client_uni.wallet_address)
+        balance = await Manager.get_balance(client_uni)
         
         if not Manager.is_balance_sufficient(balance, wrap_params["min_balance"]):
             logger.error(f'Account {account_index+1} | {client_uni.wallet_address} | Wrap cancelled: balance is less than minimum required.')
@@ -48,7 +51,7 @@ class WrapManager:
             logger.info(f'Account {account_index+1} | {client_uni.wallet_address} | Attempting to wrap {wrap_fixed_amount} ETH...')
             
             result = await client_uni.wrap_eth(
-                contract_address='0x4200000000000000000000000000000000000006',
+                contract_address=WETH_ADDRESS,
                 value=wrap_amount,
                 abi_path=WETH_ABI,
                 account_index=account_index